@@ -0,0 +1,131 @@
+"""Peak memory and latency of loading one year of attendance.
+
+Builds (or reuses) a SQLite file with `employees` x one year of weekday
+attendance, then loads the whole year three ways:
+
+  orm      Attendance ORM instances + {"rec", "hours"} dict per row (old path)
+  tuples   employee_attendance() per employee -> AttendanceRow tuples (lean per-row path)
+  columns  AttendanceColumns arrays (lean bulk path)
+
+    python bench/bench_attendance_load.py [employees] [--db PATH]
+"""
+import argparse
+import gc
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, time as dtime, timedelta
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+sys.path.insert(0, ROOT)
+
+from erp import create_app  # noqa: E402
+from erp.attendance_store import employee_attendance, load_year_columns, shift_hours  # noqa: E402
+from erp.extensions import db  # noqa: E402
+from erp.models import Employee, Attendance  # noqa: E402
+
+YEAR = 2025
+
+
+def populate(employees):
+    random.seed(7)
+    db.session.execute(Employee.__table__.insert(), [
+        {"emp_code": f"B-{i:05d}", "name": f"Employee {i}", "department": random.choice(["HR", "Sales", "Ops"]),
+         "status": "Active", "salary": 40000.0}
+        for i in range(employees)
+    ])
+    workdays = [date(YEAR, 1, 1) + timedelta(days=k) for k in range(365)]
+    workdays = [d for d in workdays if d.weekday() < 5]
+    employee_ids = [row[0] for row in db.session.execute(db.select(Employee.id))]
+    for employee_id in employee_ids:
+        rows = []
+        for d in workdays:
+            if random.random() < 0.1:
+                rows.append({"employee_id": employee_id, "date": d, "check_in": None, "check_out": None,
+                             "status": "Leave", "remarks": "Planned leave"})
+            else:
+                rows.append({"employee_id": employee_id, "date": d, "check_in": dtime(9, random.randint(0, 45)),
+                             "check_out": dtime(17, random.randint(0, 59)), "status": "Present",
+                             "remarks": "On site"})
+        db.session.execute(Attendance.__table__.insert(), rows)
+    db.session.commit()
+
+
+def load_orm():
+    records = Attendance.query.filter(
+        Attendance.date >= date(YEAR, 1, 1),
+        Attendance.date <= date(YEAR, 12, 31),
+    ).order_by(Attendance.employee_id, Attendance.date).all()
+    rows = []
+    for rec in records:
+        hours = shift_hours(rec.date, rec.check_in, rec.check_out)
+        rows.append({"rec": rec, "hours": round(hours, 2) if hours is not None else None})
+    return rows
+
+
+def load_tuples():
+    # The app's own per-employee call, as the detail modal makes it
+    employee_ids = [row[0] for row in db.session.execute(db.select(Employee.id).order_by(Employee.id))]
+    rows = []
+    for employee_id in employee_ids:
+        rows.extend(employee_attendance(employee_id, date(YEAR, 1, 1), date(YEAR, 12, 31), remarks=True))
+    return rows
+
+
+def load_columns():
+    return load_year_columns(YEAR)
+
+
+def measure(app, loader):
+    with app.app_context():
+        gc.collect()
+        t0 = time.perf_counter()
+        result = loader()
+        elapsed = time.perf_counter() - t0
+        count = len(result)
+        del result
+        db.session.remove()
+
+    with app.app_context():
+        gc.collect()
+        tracemalloc.start()
+        result = loader()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del result
+        db.session.remove()
+    return count, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("employees", nargs="?", type=int, default=5000)
+    parser.add_argument("--db", help="SQLite file to (re)use; populated if empty")
+    args = parser.parse_args()
+
+    tmp = None
+    db_path = args.db
+    if not db_path:
+        tmp = tempfile.TemporaryDirectory()
+        db_path = os.path.join(tmp.name, "attendance_bench.db")
+
+    app = create_app({"SQLALCHEMY_DATABASE_URI": "sqlite:///" + db_path, "CHANGE_CAPTURE": False})
+    with app.app_context():
+        if not db.session.query(Attendance.id).first():
+            t0 = time.perf_counter()
+            populate(args.employees)
+            print(f"populated {args.employees} employees in {time.perf_counter() - t0:.1f} s")
+
+    for name, loader in (("orm", load_orm), ("tuples", load_tuples), ("columns", load_columns)):
+        count, elapsed, peak = measure(app, loader)
+        print(f"{name:<8} {count:>9} rows   {elapsed:6.2f} s   peak {peak / 1024 / 1024:8.1f} MiB")
+
+    if tmp:
+        tmp.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Concurrency benchmark for the login path.
+
+Fires `concurrency` simultaneous logins (repeated `rounds` times) against a
+throwaway copy of the app while a background client keeps requesting a
+logged-in page, and reports login throughput plus that page's latency:
+
+    python bench/bench_login.py [concurrency] [rounds] [--single-worker]
+
+By default requests run on their own threads, like a threaded server.
+--single-worker pushes every request through one thread, like a single
+synchronous worker, so page latency includes waiting behind queued logins.
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+sys.path.insert(0, ROOT)
+
+from erp import create_app  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("concurrency", nargs="?", type=int, default=32)
+    parser.add_argument("rounds", nargs="?", type=int, default=3)
+    parser.add_argument("--single-worker", action="store_true")
+    args = parser.parse_args()
+    concurrency, rounds = args.concurrency, args.rounds
+
+    # The "server": one thread in single-worker mode, otherwise the caller's thread
+    worker = ThreadPoolExecutor(max_workers=1) if args.single_worker else None
+
+    def serve(handler):
+        return worker.submit(handler).result() if worker else handler()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        app = create_app({"SQLALCHEMY_DATABASE_URI": "sqlite:///" + os.path.join(tmp, "bench.db")})
+        app.test_cli_runner().invoke(args=["seed-demo"])
+
+        def login(_):
+            client = app.test_client()
+            t0 = time.perf_counter()
+            resp = serve(lambda: client.post("/login", data={"username": "admin", "password": "admin123"}))
+            assert resp.status_code == 302, resp.status_code
+            return time.perf_counter() - t0
+
+        # Background "other user" hitting a page while logins are in flight
+        page_latencies = []
+        stop = threading.Event()
+
+        def browse():
+            client = app.test_client()
+            serve(lambda: client.post("/login", data={"username": "admin", "password": "admin123"}))
+            while not stop.is_set():
+                t0 = time.perf_counter()
+                serve(lambda: client.get("/settings"))
+                page_latencies.append(time.perf_counter() - t0)
+
+        browser = threading.Thread(target=browse)
+        browser.start()
+
+        login_latencies = []
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            for _ in range(rounds):
+                login_latencies.extend(pool.map(login, range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+        stop.set()
+        browser.join()
+        if worker:
+            worker.shutdown()
+
+    total = len(login_latencies)
+    mode = "single worker" if args.single_worker else "threaded"
+    print(f"hash method      {app.config['PASSWORD_HASH_METHOD']}"
+          f" ({app.config['PASSWORD_HASH_WORKERS']} hash workers, {mode})")
+    print(f"logins           {total} in {elapsed:.2f} s -> {total / elapsed:.1f} logins/s")
+    print(f"login latency    median {statistics.median(login_latencies) * 1000:.1f} ms"
+          f"   max {max(login_latencies) * 1000:.1f} ms")
+    if page_latencies:
+        ordered = sorted(page_latencies)
+        p95 = ordered[int(len(ordered) * 0.95) - 1] if len(ordered) > 1 else ordered[0]
+        print(f"/settings        median {statistics.median(ordered) * 1000:.1f} ms"
+              f"   p95 {p95 * 1000:.1f} ms   ({len(ordered)} requests)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Cold-start benchmark for the app factory.
+
+Each sample runs in a fresh interpreter so import cost is included:
+
+    python bench/bench_startup.py [runs]
+
+"fresh db" starts from an empty SQLite file (schema is created), "warm db"
+reuses it (stored schema version matches, create_all() is skipped).
+"""
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+
+SNIPPET = """
+import sys, time
+t0 = time.perf_counter()
+from erp import create_app
+create_app({"SQLALCHEMY_DATABASE_URI": "sqlite:///" + sys.argv[1]})
+print(time.perf_counter() - t0)
+"""
+
+
+def sample(db_path):
+    out = subprocess.run(
+        [sys.executable, "-c", SNIPPET, db_path],
+        cwd=ROOT, check=True, capture_output=True, text=True,
+    )
+    return float(out.stdout.strip().splitlines()[-1]) * 1000.0
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    fresh, warm = [], []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for i in range(runs):
+            db_path = os.path.join(tmp, f"bench_{i}.db")
+            fresh.append(sample(db_path))
+            warm.append(sample(db_path))
+
+    for label, values in (("fresh db", fresh), ("warm db", warm)):
+        print(f"{label:<9} median {statistics.median(values):7.1f} ms"
+              f"   min {min(values):7.1f} ms   ({runs} runs)")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,3 +5,40 @@ BASE_DIR = os.path.abspath(os.path.dirname(__file__))
 SECRET_KEY = "change-this-secret-key"
 SQLALCHEMY_DATABASE_URI = "sqlite:///" + os.path.join(BASE_DIR, "saneesa.db")
 SQLALCHEMY_TRACK_MODIFICATIONS = False
+
+# Bump whenever models change; create_all() only runs when the stored
+# version differs, so warm starts skip the schema check entirely.
+SCHEMA_VERSION = 8
+AUTO_CREATE_SCHEMA = True
+
+# Max rendered table fragments (per month/year/data version) kept per process.
+FRAGMENT_CACHE_SIZE = 64
+
+# Password hashing policy. Hashes stored with other parameters are upgraded
+# on the next successful login. PASSWORD_HASH_WORKERS caps how many hashes run
+# at once across request threads; each login still blocks its own thread.
+PASSWORD_HASH_METHOD = "pbkdf2:sha256:260000"
+PASSWORD_HASH_WORKERS = 4
+
+# "database" keeps session data server-side in `user_sessions` with only a
+# signed id in the cookie; "cookie" uses Flask's default signed cookie.
+# Each worker caches sessions for SESSION_CACHE_SECONDS without re-reading
+# them, so a logout takes up to that long to reach the other workers.
+SESSION_BACKEND = "database"
+SESSION_CACHE_SECONDS = 5
+
+# Payroll policy (see erp.payroll.payroll_policy)
+PAYROLL_ALLOWED_LEAVES = 25   # paid leave days per year
+PAYROLL_DAYS_PER_MONTH = 30   # daily rate = salary / this
+PAYROLL_HOURS_PER_MONTH = 160 # hourly rate = salary / this
+PAYROLL_HOURS_PER_WEEK = 40   # weekly target; shortfall is deducted
+PAYROLL_SIM_MAX_SCENARIOS = 64  # largest what-if grid /payroll/simulate evaluates
+
+# Change-data-capture log of inventory/order/customer/employee/attendance
+# writes, served at /changes?since=<seq>.
+CHANGE_CAPTURE = True
+CHANGE_FEED_MAX_BATCH = 1000
+# A waiting long-poll holds its worker thread: keep this short on a single
+# synchronous worker, or serve /changes from a threaded or separate worker.
+CHANGE_FEED_MAX_WAIT = 5          # seconds a long-poll may wait
+CHANGE_LOG_RETENTION_DAYS = 30    # older superseded entries are compacted
@@ -0,0 +1,63 @@
+import os
+
+from flask import Flask
+
+from .extensions import db
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+
+# Modules exposing a `bp` blueprint; imported inside create_app() so that
+# importing the package does not pull in the models or any view code.
+BLUEPRINTS = [
+    "auth",
+    "dashboard",
+    "inventory",
+    "orders",
+    "customers",
+    "finance",
+    "settings",
+    "employees",
+    "attendance",
+    "payroll",
+    "changes",
+    "analytics",
+]
+
+
+def create_app(config_overrides=None):
+    app = Flask(
+        __name__,
+        template_folder=os.path.join(BASE_DIR, "templates"),
+        static_folder=os.path.join(BASE_DIR, "static"),
+    )
+    app.config.from_pyfile(os.path.join(BASE_DIR, "config.py"))
+    if config_overrides:
+        app.config.update(config_overrides)
+
+    db.init_app(app)
+
+    if app.config.get("SESSION_BACKEND") == "database":
+        from .sessions import DatabaseSessionInterface
+        app.session_interface = DatabaseSessionInterface()
+
+    from importlib import import_module
+    for name in BLUEPRINTS:
+        module = import_module(f".{name}", __name__)
+        app.register_blueprint(module.bp)
+
+    from .fragments import register_version_tracking
+    register_version_tracking()
+
+    if app.config.get("CHANGE_CAPTURE", True):
+        from .changes import register_change_capture
+        register_change_capture()
+
+    from .cli import register_commands
+    register_commands(app)
+
+    if app.config.get("AUTO_CREATE_SCHEMA", True):
+        from .schema import ensure_schema
+        with app.app_context():
+            ensure_schema(app)
+
+    return app
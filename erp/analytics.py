@@ -0,0 +1,301 @@
+import json
+from collections import defaultdict
+from datetime import date
+
+from flask import Blueprint, current_app, jsonify, request
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+from .auth import login_required
+from .extensions import db
+from .models import (
+    Employee,
+    Attendance,
+    ChangeLogEntry,
+    AnalyticsEmployeeMonth,
+    AnalyticsCell,
+    AnalyticsState,
+)
+from .payroll import payroll_policy
+from .payroll_sim import load_payroll_inputs, payroll_columns, UNASSIGNED
+
+bp = Blueprint("analytics", __name__)
+
+DIMENSIONS = ("department", "year", "month", "status")
+MEASURES = ("headcount", "present_days", "absent_days", "leave_days", "shortfall_hours", "payroll_cost")
+SUMMED = MEASURES[1:]
+
+
+def _tracked_years():
+    """Years with any attendance, plus the current year."""
+    year_rows = db.session.query(db.func.strftime("%Y", Attendance.date)).distinct().all()
+    return sorted({int(y[0]) for y in year_rows if y[0] is not None} | {date.today().year})
+
+
+def _year_built(year):
+    cube = AnalyticsCell.__table__
+    return db.session.execute(
+        db.select(cube.c.year).where(cube.c.year == year).limit(1)
+    ).first() is not None
+
+
+def _has_attendance(year):
+    return db.session.query(Attendance.id).filter(
+        Attendance.date >= date(year, 1, 1),
+        Attendance.date <= date(year, 12, 31),
+    ).first() is not None
+
+
+def _drop_years(years=None):
+    """Delete facts and cells of `years`, or of every year when None."""
+    for table in (AnalyticsEmployeeMonth.__table__, AnalyticsCell.__table__):
+        stmt = table.delete()
+        if years is not None:
+            stmt = stmt.where(table.c.year.in_(years))
+        db.session.execute(stmt)
+
+
+def refresh_employee_facts(year, employee_ids=None):
+    """Recompute the employee-month facts of `year`, for all or only some employees."""
+    # Staff only count towards headcount and cost from the month they joined
+    inputs = load_payroll_inputs(year, employee_ids=employee_ids, from_joining=True)
+    _, shortfall, net_pay = payroll_columns(inputs, payroll_policy())
+
+    count_query = db.session.query(
+        Attendance.employee_id,
+        db.func.strftime("%m", Attendance.date),
+        Attendance.status,
+        db.func.count(Attendance.id),
+    ).filter(
+        Attendance.date >= date(year, 1, 1),
+        Attendance.date <= date(year, 12, 31),
+    )
+    status_query = db.session.query(Employee.id, Employee.status)
+    if employee_ids is not None:
+        count_query = count_query.filter(Attendance.employee_id.in_(employee_ids))
+        status_query = status_query.filter(Employee.id.in_(employee_ids))
+
+    day_counts = defaultdict(int)
+    for employee_id, month, status, count in count_query.group_by(
+        Attendance.employee_id, db.func.strftime("%m", Attendance.date), Attendance.status
+    ):
+        day_counts[(employee_id, int(month), status)] = count
+    statuses = dict(status_query.all())
+
+    rows = []
+    for i, employee_id in enumerate(inputs["employee_id"]):
+        month = inputs["month"][i]
+        rows.append({
+            "employee_id": employee_id,
+            "year": year,
+            "month": month,
+            "department": inputs["department"][i],
+            "status": statuses.get(employee_id) or UNASSIGNED,
+            "present_days": day_counts[(employee_id, month, "Present")],
+            "absent_days": day_counts[(employee_id, month, "Absent")],
+            "leave_days": day_counts[(employee_id, month, "Leave")],
+            "shortfall_hours": shortfall[i],
+            "payroll_cost": net_pay[i],
+        })
+
+    facts = AnalyticsEmployeeMonth.__table__
+    stale = facts.delete().where(facts.c.year == year)
+    if employee_ids is not None:
+        stale = stale.where(facts.c.employee_id.in_(employee_ids))
+    db.session.execute(stale)
+    if rows:
+        db.session.execute(facts.insert(), rows)
+
+
+def rebuild_cube_year(year):
+    """Re-aggregate the cube cells of `year` from the employee-month facts."""
+    facts = AnalyticsEmployeeMonth.__table__
+    cube = AnalyticsCell.__table__
+    db.session.execute(cube.delete().where(cube.c.year == year))
+    db.session.execute(cube.insert().from_select(
+        ["department", "year", "month", "status", "headcount", *SUMMED],
+        db.select(
+            facts.c.department,
+            facts.c.year,
+            facts.c.month,
+            facts.c.status,
+            db.func.count(facts.c.employee_id),
+            *(db.func.sum(facts.c[m]) for m in SUMMED),
+        ).where(
+            facts.c.year == year
+        ).group_by(
+            facts.c.department, facts.c.year, facts.c.month, facts.c.status
+        )
+    ))
+
+
+def refresh_cube(full=False):
+    """Bring the cube up to date with the change log; returns the number of years rebuilt.
+
+    Only employees touched by attendance or employee changes since the last
+    refresh are recomputed, so a refresh with nothing new costs a few small
+    queries. Without change capture, or when `full` is set, the cube is cleared
+    and every tracked year rebuilt.
+    """
+    state = db.session.get(AnalyticsState, 1)
+    if state is None:
+        state = AnalyticsState(id=1, last_seq=AnalyticsState.NOT_BUILT)
+        db.session.add(state)
+    if state.last_seq == AnalyticsState.NOT_BUILT:
+        full = True
+    if not current_app.config.get("CHANGE_CAPTURE", True):
+        full = True
+
+    # Read the watermark first so changes committed meanwhile wait for the next refresh
+    max_seq = db.session.query(db.func.max(ChangeLogEntry.seq)).scalar() or 0
+
+    if full:
+        # Start from nothing so years that lost all their attendance disappear
+        _drop_years()
+        affected = {year: None for year in _tracked_years()}
+    else:
+        current_year = date.today().year
+        current_built = _year_built(current_year)
+        if max_seq <= state.last_seq and current_built:
+            return 0
+        changes = db.session.query(
+            ChangeLogEntry.table_name, ChangeLogEntry.row_id, ChangeLogEntry.data
+        ).filter(
+            ChangeLogEntry.seq > state.last_seq,
+            ChangeLogEntry.seq <= max_seq,
+            ChangeLogEntry.table_name.in_(("attendance", "employees")),
+        ).all()
+
+        affected = defaultdict(set)
+        tracked = None
+        for table_name, row_id, data in changes:
+            if table_name == "attendance":
+                row = json.loads(data) if data else {}
+                if row.get("employee_id") and row.get("date"):
+                    affected[int(row["date"][:4])].add(row["employee_id"])
+            else:
+                # Department, status or salary may have changed: every year
+                tracked = tracked or _tracked_years()
+                for year in tracked:
+                    affected[year].add(row_id)
+
+        # A year without facts yet (first activity in it, or a new year that
+        # just started) is built for every employee, not only the changed ones.
+        if not current_built:
+            affected[current_year] = None
+        for year in list(affected):
+            if year != current_year and not _has_attendance(year):
+                # Its last attendance row was deleted: no longer a tracked year
+                _drop_years([year])
+                del affected[year]
+            elif affected[year] is not None and not _year_built(year):
+                affected[year] = None
+
+    for year, employee_ids in affected.items():
+        refresh_employee_facts(year, employee_ids)
+        rebuild_cube_year(year)
+
+    state.last_seq = max_seq
+    db.session.commit()
+    return len(affected)
+
+
+def cube_built():
+    state = db.session.get(AnalyticsState, 1)
+    return state is not None and state.last_seq != AnalyticsState.NOT_BUILT
+
+
+def refresh_cube_for_request():
+    """Apply new changes to the cube from a request; False until `flask build-cube` has run.
+
+    Full builds are left to the CLI, as is every refresh when change capture
+    is off. A refresh that collides with one running in another request is
+    rolled back; the next request applies those changes instead.
+    """
+    if not cube_built():
+        return False
+    if current_app.config.get("CHANGE_CAPTURE", True):
+        try:
+            refresh_cube()
+        except (IntegrityError, OperationalError):
+            db.session.rollback()
+        except Exception:
+            # The request's session is reused to save the user session; never hand it back broken
+            db.session.rollback()
+            raise
+    return True
+
+
+def check_dimensions(filters, group_by):
+    for name in list(filters) + list(group_by):
+        if name not in DIMENSIONS:
+            raise ValueError(f"Unknown dimension: {name}")
+
+
+def query_cube(filters=None, group_by=(), projected=False):
+    """Slice the cube by `filters` ({dimension: [values]}) and roll up to `group_by`.
+
+    Day, hour and cost measures are summed. Headcount is averaged over the
+    months in each group, so rolling months up gives average monthly headcount.
+    Months after the current one hold projected payroll and are left out
+    unless `projected` is set.
+    """
+    cube = AnalyticsCell.__table__
+    filters = filters or {}
+    check_dimensions(filters, group_by)
+
+    period = cube.c.year * 100 + cube.c.month
+    columns = [cube.c[d] for d in group_by]
+    stmt = db.select(
+        *columns,
+        (db.func.sum(cube.c.headcount) * 1.0 / db.func.count(db.distinct(period))).label("headcount"),
+        *(db.func.sum(cube.c[m]).label(m) for m in SUMMED),
+    )
+    for name, values in filters.items():
+        stmt = stmt.where(cube.c[name].in_(values))
+    if not projected:
+        today = date.today()
+        stmt = stmt.where(period <= today.year * 100 + today.month)
+    if columns:
+        stmt = stmt.group_by(*columns).order_by(*columns)
+
+    rows = []
+    for row in db.session.execute(stmt):
+        if row.headcount is None:
+            continue  # nothing matched the filters
+        item = {d: getattr(row, d) for d in group_by}
+        item["headcount"] = round(row.headcount, 2)
+        for m in SUMMED:
+            item[m] = round(getattr(row, m) or 0, 2)
+        rows.append(item)
+    return rows
+
+
+def _list_arg(name, cast=str):
+    raw = (request.args.get(name) or "").strip()
+    return [cast(v.strip()) for v in raw.split(",") if v.strip()] if raw else []
+
+
+@bp.route("/analytics/cube")
+@login_required
+def cube_query():
+    """e.g. ?year=2025&department=HR,Sales&group_by=department,month[&projected=1]"""
+    try:
+        filters = {}
+        for name in DIMENSIONS:
+            values = _list_arg(name, int if name in ("year", "month") else str)
+            if values:
+                filters[name] = values
+        group_by = _list_arg("group_by")
+        projected = request.args.get("projected") in ("1", "true")
+        check_dimensions(filters, group_by)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    if not refresh_cube_for_request():
+        return jsonify({"error": "Analytics cube not built yet; run `flask --app app build-cube`"}), 503
+    return jsonify({
+        "group_by": group_by,
+        "filters": filters,
+        "projected": projected,
+        "rows": query_cube(filters, group_by, projected),
+    })
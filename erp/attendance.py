@@ -0,0 +1,195 @@
+from flask import Blueprint, render_template, request, redirect, url_for, flash
+from datetime import date, datetime, timedelta
+
+from .attendance_store import employee_attendance
+from .auth import login_required
+from .extensions import db
+from .fragments import MONTH_NAMES, cached_fragment, employee_id_from_args, month_year_from_args
+from .models import Employee, Attendance
+
+bp = Blueprint("attendance", __name__)
+
+
+def parse_time_or_none(value: str):
+    value = (value or "").strip()
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, "%H:%M").time()
+    except ValueError:
+        return None
+
+
+@bp.route("/attendance", methods=["GET", "POST"])
+@login_required
+def attendance_page():
+    # Add new attendance (from New Entry modal)
+    if request.method == "POST":
+        employee_id_raw = request.form.get("employee_id") or ""
+        date_str = (request.form.get("date") or "").strip()
+        check_in_str = (request.form.get("check_in") or "").strip()
+        check_out_str = (request.form.get("check_out") or "").strip()
+        status = (request.form.get("status") or "Present").strip()
+        remarks = (request.form.get("remarks") or "").strip()
+
+        try:
+            employee_id = int(employee_id_raw)
+        except ValueError:
+            employee_id = 0
+
+        if not employee_id or not date_str:
+            flash("Employee and Date are required.", "error")
+        else:
+            try:
+                d = datetime.strptime(date_str, "%Y-%m-%d").date()
+            except ValueError:
+                d = None
+
+            if not d:
+                flash("Invalid date.", "error")
+            else:
+                existing = Attendance.query.filter_by(employee_id=employee_id, date=d).first()
+                if existing:
+                    flash("Attendance for this employee and date already exists.", "error")
+                else:
+                    ci = parse_time_or_none(check_in_str)
+                    co = parse_time_or_none(check_out_str)
+                    rec = Attendance(
+                        employee_id=employee_id,
+                        date=d,
+                        check_in=ci,
+                        check_out=co,
+                        status=status,
+                        remarks=remarks
+                    )
+                    db.session.add(rec)
+                    db.session.commit()
+                    flash("Attendance record added.", "success")
+
+        return redirect(url_for("attendance.attendance_page"))
+
+    # ---------- GET: monthly overview + optional detail modal ----------
+    month, year = month_year_from_args(request.args)
+    employee_id = employee_id_from_args(request.args)  # for detail modal
+
+    employees = Employee.query.order_by(Employee.name).all()
+
+    return render_template(
+        "attendance.html",
+        page_title="Attendance",
+        table_body=render_overview_body(month, year),
+        employees=employees,   # needed for New Entry modal
+        month=month,
+        year=year,
+        month_names=MONTH_NAMES,
+        **detail_context(employee_id, year)
+    )
+
+
+@bp.route("/attendance/fragment/table")
+@login_required
+def attendance_table_fragment():
+    month, year = month_year_from_args(request.args)
+    return render_overview_body(month, year)
+
+
+@bp.route("/attendance/fragment/detail")
+@login_required
+def attendance_detail_fragment():
+    month, year = month_year_from_args(request.args)
+    employee_id = employee_id_from_args(request.args)
+    return render_template(
+        "partials/attendance_detail.html",
+        month=month,
+        year=year,
+        **detail_context(employee_id, year)
+    )
+
+
+def render_overview_body(month, year):
+    """Rendered <tbody> rows of the monthly overview, cached per data version."""
+    def render():
+        # Month range
+        start_date = date(year, month, 1)
+        if month == 12:
+            next_month = date(year + 1, 1, 1)
+        else:
+            next_month = date(year, month + 1, 1)
+        end_date = next_month - timedelta(days=1)
+
+        # Monthly overview (days recorded per employee)
+        overview = []
+        for emp in Employee.query.order_by(Employee.name).all():
+            days_recorded = Attendance.query.filter(
+                Attendance.employee_id == emp.id,
+                Attendance.date >= start_date,
+                Attendance.date <= end_date
+            ).count()
+            overview.append({
+                "employee": emp,
+                "days_recorded": days_recorded
+            })
+
+        return render_template(
+            "partials/attendance_rows.html",
+            overview=overview,
+            month=month,
+            year=year
+        )
+
+    return cached_fragment("attendance_rows", month, year, render)
+
+
+def detail_context(employee_id, year):
+    """Template context for the yearly detail modal of one employee."""
+    selected_employee = None
+    record_rows = []
+    available_years = []
+
+    if employee_id:
+        selected_employee = Employee.query.get(employee_id)
+
+        if selected_employee:
+            # For detailed view we use the same `year` param (1 year at a time)
+            year_start = date(year, 1, 1)
+            year_end = date(year, 12, 31)
+
+            # Lean tuples; each row exposes .hours for the template
+            record_rows = employee_attendance(employee_id, year_start, year_end, remarks=True)
+
+            # Available years in which this employee has attendance
+            year_rows = db.session.query(
+                db.func.strftime("%Y", Attendance.date)
+            ).filter(
+                Attendance.employee_id == employee_id
+            ).distinct().all()
+
+            available_years = sorted({int(y[0]) for y in year_rows if y[0] is not None}) or [year]
+
+    return {
+        "selected_employee": selected_employee,
+        "record_rows": record_rows,
+        "available_years": available_years,
+    }
+
+
+@bp.route("/attendance/delete/<int:record_id>", methods=["POST"])
+@login_required
+def delete_attendance_record(record_id):
+    record = Attendance.query.get(record_id)
+    if not record:
+        flash("Attendance record not found.", "error")
+        return redirect(url_for("attendance.attendance_page"))
+
+    employee_id = record.employee_id
+    month = record.date.month
+    year = record.date.year
+
+    db.session.delete(record)
+    db.session.commit()
+    flash("Attendance entry deleted.", "success")
+
+    return redirect(url_for("attendance.attendance_page",
+                            month=month,
+                            year=year,
+                            employee_id=employee_id))
@@ -0,0 +1,116 @@
+from array import array
+from datetime import date, datetime, time
+from typing import NamedTuple, Optional
+
+from .extensions import db
+from .models import Attendance
+
+# Rows streamed from the driver per batch by load_year_columns()
+STREAM_BATCH = 5000
+
+STATUS_CODES = {"Present": 0, "Absent": 1, "Leave": 2}
+STATUS_NAMES = {code: name for name, code in STATUS_CODES.items()}
+OTHER_STATUS = 3
+NO_TIME = -1  # check_in/check_out missing in AttendanceColumns
+
+
+def shift_hours(on_date, check_in, check_out):
+    """Hours between check-in and check-out on `on_date`, or None when either is missing."""
+    if not (check_in and check_out):
+        return None
+    delta = datetime.combine(on_date, check_out) - datetime.combine(on_date, check_in)
+    return delta.total_seconds() / 3600.0
+
+
+class AttendanceRow(NamedTuple):
+    """Read-only attendance record: a plain tuple, no identity map or relationships."""
+    id: int
+    date: date
+    check_in: Optional[time]
+    check_out: Optional[time]
+    status: str
+    remarks: Optional[str]
+
+    @property
+    def hours(self):
+        hours = shift_hours(self.date, self.check_in, self.check_out)
+        return round(hours, 2) if hours is not None else None
+
+
+def employee_attendance(employee_id, start, end, statuses=None, remarks=False):
+    """AttendanceRow tuples of one employee between `start` and `end` (inclusive), by date.
+
+    `remarks` is only selected when asked for; otherwise the field is None.
+    """
+    stmt = db.select(
+        Attendance.id,
+        Attendance.date,
+        Attendance.check_in,
+        Attendance.check_out,
+        Attendance.status,
+        Attendance.remarks if remarks else db.null(),
+    ).where(
+        Attendance.employee_id == employee_id,
+        Attendance.date >= start,
+        Attendance.date <= end,
+    ).order_by(Attendance.date.asc())
+    if statuses:
+        stmt = stmt.where(Attendance.status.in_(statuses))
+    return [AttendanceRow._make(row) for row in db.session.execute(stmt)]
+
+
+class AttendanceColumns:
+    """Array-backed store of many attendance rows.
+
+    Dates are ordinals, times are seconds since midnight (NO_TIME when
+    missing) and statuses are STATUS_CODES, so a row costs a few bytes
+    instead of an ORM instance.
+    """
+
+    __slots__ = ("employee_id", "day", "check_in", "check_out", "status")
+
+    def __init__(self):
+        self.employee_id = array("i")
+        self.day = array("i")
+        self.check_in = array("i")
+        self.check_out = array("i")
+        self.status = array("b")
+
+    def __len__(self):
+        return len(self.day)
+
+    def append(self, employee_id, on_date, check_in, check_out, status):
+        self.employee_id.append(employee_id)
+        self.day.append(on_date.toordinal())
+        self.check_in.append(_seconds(check_in))
+        self.check_out.append(_seconds(check_out))
+        self.status.append(STATUS_CODES.get(status, OTHER_STATUS))
+
+
+def _seconds(value):
+    if value is None:
+        return NO_TIME
+    return value.hour * 3600 + value.minute * 60 + value.second
+
+
+def load_year_columns(year, employee_ids=None, statuses=None):
+    """All attendance of `year` as AttendanceColumns, streamed in batches."""
+    stmt = db.select(
+        Attendance.employee_id,
+        Attendance.date,
+        Attendance.check_in,
+        Attendance.check_out,
+        Attendance.status,
+    ).where(
+        Attendance.date >= date(year, 1, 1),
+        Attendance.date <= date(year, 12, 31),
+    ).execution_options(yield_per=STREAM_BATCH)
+    if employee_ids is not None:
+        stmt = stmt.where(Attendance.employee_id.in_(employee_ids))
+    if statuses:
+        stmt = stmt.where(Attendance.status.in_(statuses))
+
+    columns = AttendanceColumns()
+    for row in db.session.execute(stmt):
+        columns.append(*row)
+    return columns
@@ -0,0 +1,45 @@
+from flask import Blueprint, render_template, request, redirect, url_for, flash, session
+from functools import wraps
+
+from .extensions import db
+from .models import Admin
+from .passwords import hash_password, needs_rehash, verify_password
+
+bp = Blueprint("auth", __name__)
+
+
+def login_required(f):
+    @wraps(f)
+    def wrapper(*args, **kwargs):
+        if "admin_id" not in session:
+            return redirect(url_for("auth.login"))
+        return f(*args, **kwargs)
+    return wrapper
+
+
+@bp.route("/login", methods=["GET", "POST"])
+def login():
+    if request.method == "POST":
+        username = (request.form.get("username") or "").strip()
+        password = request.form.get("password") or ""
+
+        admin = Admin.query.filter_by(username=username).first()
+        if admin and verify_password(admin.password, password):
+            # Upgrade hashes made under an older policy while we have the plaintext
+            if needs_rehash(admin.password):
+                admin.password = hash_password(password)
+                db.session.commit()
+
+            session.clear()
+            session["admin_id"] = admin.id
+            return redirect(url_for("dashboard.dashboard"))
+
+        flash("Invalid username or password", "error")
+
+    return render_template("login.html")
+
+
+@bp.route("/logout")
+def logout():
+    session.clear()
+    return redirect(url_for("auth.login"))
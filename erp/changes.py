@@ -0,0 +1,141 @@
+import json
+import time
+from datetime import date, datetime, time as dtime, timedelta, timezone
+
+from flask import Blueprint, current_app, jsonify, request
+from sqlalchemy import event, inspect
+
+from .auth import login_required
+from .extensions import db
+from .models import InventoryItem, Customer, Order, Employee, Attendance, ChangeLogEntry
+
+bp = Blueprint("changes", __name__)
+
+# Models whose writes are published. Admin and session rows are deliberately
+# left out: they hold password hashes and session data.
+CAPTURED_MODELS = (InventoryItem, Customer, Order, Employee, Attendance)
+
+
+def _utcnow():
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _json_value(value):
+    if isinstance(value, (date, datetime, dtime)):
+        return value.isoformat()
+    return value
+
+
+def _snapshot(obj):
+    return {
+        attr.key: _json_value(getattr(obj, attr.key))
+        for attr in inspect(obj).mapper.column_attrs
+    }
+
+
+def _capture_changes(session, flush_context):
+    if not current_app.config.get("CHANGE_CAPTURE", True):
+        return
+
+    now = _utcnow()
+    entries = []
+
+    def add(obj, op):
+        if isinstance(obj, CAPTURED_MODELS):
+            entries.append({
+                "table_name": obj.__tablename__,
+                "row_id": obj.id,
+                "op": op,
+                "data": json.dumps(_snapshot(obj)),
+                "created_at": now,
+            })
+
+    for obj in session.new:
+        add(obj, "insert")
+    for obj in session.dirty:
+        if session.is_modified(obj, include_collections=False):
+            add(obj, "update")
+    for obj in session.deleted:
+        add(obj, "delete")
+
+    if entries:
+        # Same connection and transaction as the flush: a change is logged
+        # if and only if it is committed.
+        session.connection().execute(ChangeLogEntry.__table__.insert(), entries)
+
+
+def register_change_capture():
+    if not event.contains(db.session, "after_flush", _capture_changes):
+        event.listen(db.session, "after_flush", _capture_changes)
+
+
+def _entry_dict(row):
+    return {
+        "seq": row.seq,
+        "table": row.table_name,
+        "row_id": row.row_id,
+        "op": row.op,
+        "data": json.loads(row.data) if row.data else None,
+        "at": row.created_at.isoformat(),
+    }
+
+
+def fetch_changes(since, limit):
+    table = ChangeLogEntry.__table__
+    rows = db.session.execute(
+        db.select(table).where(table.c.seq > since).order_by(table.c.seq).limit(limit)
+    ).all()
+    return [_entry_dict(row) for row in rows]
+
+
+def compact_change_log(older_than_days):
+    """Drop entries older than the cutoff that a later entry for the same row supersedes.
+
+    Consumers that fall behind can still resume from any sequence number; they
+    just skip intermediate states of rows that changed again later.
+    """
+    cutoff = _utcnow() - timedelta(days=older_than_days)
+    log = ChangeLogEntry.__table__
+    newer = log.alias("newer")
+    superseded = db.select(newer.c.seq).where(
+        newer.c.table_name == log.c.table_name,
+        newer.c.row_id == log.c.row_id,
+        newer.c.seq > log.c.seq,
+    ).exists()
+    removed = db.session.execute(
+        log.delete().where(log.c.created_at < cutoff, superseded)
+    ).rowcount
+    db.session.commit()
+    return removed
+
+
+@bp.route("/changes")
+@login_required
+def changes_feed():
+    """Changes after ?since=<seq>, oldest first; ?wait=<s> long-polls while empty.
+
+    A long poll occupies its worker thread for up to CHANGE_FEED_MAX_WAIT.
+    """
+    try:
+        since = int(request.args.get("since") or 0)
+        limit = int(request.args.get("limit") or 500)
+        wait = float(request.args.get("wait") or 0)
+    except ValueError:
+        return jsonify({"error": "since, limit and wait must be numbers"}), 400
+
+    limit = max(1, min(limit, current_app.config.get("CHANGE_FEED_MAX_BATCH", 1000)))
+    wait = max(0.0, min(wait, current_app.config.get("CHANGE_FEED_MAX_WAIT", 5)))
+
+    deadline = time.monotonic() + wait
+    changes = fetch_changes(since, limit)
+    while not changes and time.monotonic() < deadline:
+        # End the read transaction so the next poll sees newly committed rows
+        db.session.rollback()
+        time.sleep(0.5)
+        changes = fetch_changes(since, limit)
+
+    return jsonify({
+        "changes": changes,
+        "next_since": changes[-1]["seq"] if changes else since,
+        "has_more": len(changes) == limit,
+    })
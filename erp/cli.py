@@ -0,0 +1,72 @@
+import click
+
+from .extensions import db
+
+
+def register_commands(app):
+    @app.cli.command("init-db")
+    def init_db_command():
+        """Create all tables, ignoring the stored schema version."""
+        from .schema import create_tables
+
+        create_tables()
+        click.echo("Database tables created.")
+
+    @app.cli.command("seed-demo")
+    def seed_demo_command():
+        """Insert demo records into any empty module tables."""
+        from .seed import seed_demo_data
+
+        seed_demo_data()
+        click.echo("Demo data seeded.")
+
+    @app.cli.command("create-admin")
+    @click.option("--username", prompt=True)
+    @click.option("--password", prompt=True, hide_input=True, confirmation_prompt=True)
+    def create_admin_command(username, password):
+        """Create an admin login, or reset the password of an existing one."""
+        from .models import Admin
+        from .passwords import hash_password
+
+        username = username.strip()
+        if not username or not password:
+            raise click.BadParameter("username and password must not be empty")
+
+        admin = Admin.query.filter_by(username=username).first()
+        if admin is None:
+            db.session.add(Admin(username=username, password=hash_password(password)))
+            action = "created"
+        else:
+            admin.password = hash_password(password)
+            action = "updated"
+        db.session.commit()
+        click.echo(f"Admin '{username}' {action}.")
+
+    @app.cli.command("purge-sessions")
+    def purge_sessions_command():
+        """Delete expired server-side sessions."""
+        from .sessions import purge_expired_sessions
+
+        removed = purge_expired_sessions()
+        click.echo(f"Removed {removed} expired session(s).")
+
+    @app.cli.command("compact-changes")
+    @click.option("--older-than-days", type=int, default=None,
+                  help="Defaults to CHANGE_LOG_RETENTION_DAYS.")
+    def compact_changes_command(older_than_days):
+        """Drop superseded change-log entries older than the retention window."""
+        from .changes import compact_change_log
+
+        if older_than_days is None:
+            older_than_days = app.config.get("CHANGE_LOG_RETENTION_DAYS", 30)
+        removed = compact_change_log(older_than_days)
+        click.echo(f"Removed {removed} superseded change-log entry(ies).")
+
+    @app.cli.command("build-cube")
+    @click.option("--full", is_flag=True, help="Rebuild every year instead of applying new changes.")
+    def build_cube_command(full):
+        """Bring the department analytics cube up to date."""
+        from .analytics import refresh_cube
+
+        years = refresh_cube(full=full)
+        click.echo(f"Analytics cube refreshed ({years} year(s) rebuilt).")
@@ -0,0 +1,30 @@
+from flask import Blueprint, render_template, request, redirect, url_for, flash
+
+from .auth import login_required
+from .extensions import db
+from .models import Customer
+
+bp = Blueprint("customers", __name__)
+
+
+@bp.route("/customers", methods=["GET", "POST"])
+@login_required
+def customers_page():
+    if request.method == "POST":
+        name = (request.form.get("name") or "").strip()
+        email = (request.form.get("email") or "").strip()
+        phone = (request.form.get("phone") or "").strip()
+        company = (request.form.get("company") or "").strip()
+
+        if not name:
+            flash("Customer name is required.", "error")
+        else:
+            customer = Customer(name=name, email=email, phone=phone, company=company)
+            db.session.add(customer)
+            db.session.commit()
+            flash("Customer added.", "success")
+
+        return redirect(url_for("customers.customers_page"))
+
+    customers = Customer.query.order_by(Customer.id.desc()).all()
+    return render_template("customers.html", page_title="Customers", customers=customers)
@@ -0,0 +1,90 @@
+from flask import Blueprint, render_template, Response
+from datetime import date
+from io import StringIO
+import csv
+
+from .analytics import query_cube, refresh_cube_for_request
+from .auth import login_required
+from .extensions import db
+from .models import InventoryItem, Customer, Order, Employee, Attendance
+
+bp = Blueprint("dashboard", __name__)
+
+
+def get_module_usage():
+    """Return (rows, total_records) for module usage on dashboard & reports."""
+    rows = []
+
+    inv_count = InventoryItem.query.count()
+    orders_count = Order.query.count()
+    customers_count = Customer.query.count()
+    employees_count = Employee.query.count()
+    attendance_count = Attendance.query.count()
+
+    rows.append({"name": "Inventory", "records": inv_count})
+    rows.append({"name": "Orders", "records": orders_count})
+    rows.append({"name": "Customers", "records": customers_count})
+    rows.append({"name": "Employees", "records": employees_count})
+    rows.append({"name": "Attendance Records", "records": attendance_count})
+
+    total = sum(r["records"] for r in rows) or 1
+
+    for r in rows:
+        r["percentage"] = round((r["records"] / total) * 100, 1) if r["records"] else 0.0
+
+    return rows, total
+
+
+@bp.route("/")
+@login_required
+def dashboard():
+    total_items = db.session.query(db.func.count(InventoryItem.id)).scalar() or 0
+    low_stock = InventoryItem.query.filter(InventoryItem.quantity <= InventoryItem.reorder_level).count()
+    total_customers = db.session.query(db.func.count(Customer.id)).scalar() or 0
+    total_orders = db.session.query(db.func.count(Order.id)).scalar() or 0
+
+    recent_orders = Order.query.order_by(Order.id.desc()).limit(6).all()
+
+    module_usage, total_usage = get_module_usage()
+
+    # Year-to-date department breakdown, served from the analytics cube
+    analytics_year = date.today().year
+    analytics_ready = refresh_cube_for_request()
+    departments = query_cube({"year": [analytics_year]}, ["department"]) if analytics_ready else []
+
+    return render_template(
+        "dashboard.html",
+        page_title="Dashboard",
+        total_items=total_items,
+        low_stock=low_stock,
+        total_customers=total_customers,
+        total_orders=total_orders,
+        orders=recent_orders,
+        module_usage=module_usage,
+        total_usage=total_usage,
+        analytics_year=analytics_year,
+        analytics_ready=analytics_ready,
+        departments=departments,
+    )
+
+
+@bp.route("/usage-report")
+@login_required
+def usage_report():
+    rows, total = get_module_usage()
+
+    output = StringIO()
+    writer = csv.writer(output)
+
+    writer.writerow(["Module", "Records", "Percentage of total", "Generated on"])
+    today_str = date.today().strftime("%Y-%m-%d")
+
+    for r in rows:
+        writer.writerow([r["name"], r["records"], f'{r["percentage"]}%', today_str])
+
+    csv_data = output.getvalue()
+    filename = f"module_usage_{date.today().strftime('%Y%m%d')}.csv"
+
+    resp = Response(csv_data, mimetype="text/csv")
+    resp.headers["Content-Disposition"] = f"attachment; filename={filename}"
+    return resp
@@ -0,0 +1,68 @@
+from flask import Blueprint, render_template, request, redirect, url_for, flash
+
+from .auth import login_required
+from .extensions import db
+from .models import Employee
+
+bp = Blueprint("employees", __name__)
+
+
+@bp.route("/employees", methods=["GET", "POST"])
+@login_required
+def employees_page():
+    if request.method == "POST":
+        emp_code = (request.form.get("emp_code") or "").strip()
+        name = (request.form.get("name") or "").strip()
+        department = (request.form.get("department") or "").strip()
+        designation = (request.form.get("designation") or "").strip()
+        email = (request.form.get("email") or "").strip()
+        phone = (request.form.get("phone") or "").strip()
+        date_of_joining = (request.form.get("date_of_joining") or "").strip()
+        status = (request.form.get("status") or "Active").strip()
+        salary_raw = request.form.get("salary") or "0"
+
+        try:
+            salary = float(salary_raw)
+        except ValueError:
+            salary = 0.0
+
+        if not emp_code or not name:
+            flash("Employee Code and Name are required.", "error")
+        else:
+            existing = Employee.query.filter_by(emp_code=emp_code).first()
+            if existing:
+                flash("An employee with this code already exists.", "error")
+            else:
+                employee = Employee(
+                    emp_code=emp_code,
+                    name=name,
+                    department=department,
+                    designation=designation,
+                    email=email,
+                    phone=phone,
+                    date_of_joining=date_of_joining,
+                    status=status,
+                    salary=salary
+                )
+                db.session.add(employee)
+                db.session.commit()
+                flash("Employee added.", "success")
+
+        return redirect(url_for("employees.employees_page"))
+
+    q = (request.args.get("q") or "").strip()
+
+    if q:
+        pattern = f"%{q}%"
+        employees = Employee.query.filter(
+            (Employee.name.ilike(pattern)) | (Employee.emp_code.ilike(pattern))
+        ).order_by(Employee.id.desc()).all()
+    else:
+        employees = Employee.query.order_by(Employee.id.desc()).all()
+
+    return render_template(
+        "employees.html",
+        page_title="Employees",
+        employees=employees,
+        search_query=q
+    )
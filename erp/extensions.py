@@ -0,0 +1,4 @@
+from flask_sqlalchemy import SQLAlchemy
+
+# Bound to the app in create_app(); importing this module stays cheap.
+db = SQLAlchemy()
@@ -0,0 +1,23 @@
+from flask import Blueprint, render_template
+
+from .auth import login_required
+from .extensions import db
+from .models import Order
+
+bp = Blueprint("finance", __name__)
+
+
+@bp.route("/finance")
+@login_required
+def finance_page():
+    total_paid = db.session.query(db.func.sum(Order.amount)).filter(Order.status == "Paid").scalar() or 0
+    total_overdue = db.session.query(db.func.sum(Order.amount)).filter(Order.status == "Overdue").scalar() or 0
+    total_pending = db.session.query(db.func.sum(Order.amount)).filter(Order.status == "Pending").scalar() or 0
+
+    return render_template(
+        "finance.html",
+        page_title="Finance",
+        total_paid=total_paid,
+        total_overdue=total_overdue,
+        total_pending=total_pending
+    )
@@ -0,0 +1,127 @@
+from collections import OrderedDict
+from datetime import MAXYEAR, MINYEAR, date
+from itertools import chain
+from threading import Lock
+
+from flask import current_app
+from markupsafe import Markup
+from sqlalchemy import event
+
+from .extensions import db
+from .models import Employee, Attendance
+from .versions import HR, bump_version, read_version
+
+MONTH_NAMES = [
+    (1, "January"), (2, "February"), (3, "March"), (4, "April"),
+    (5, "May"), (6, "June"), (7, "July"), (8, "August"),
+    (9, "September"), (10, "October"), (11, "November"), (12, "December")
+]
+
+
+def month_year_from_args(args):
+    """Read ?month=&year= from the query string, defaulting to today.
+
+    Values that are not numbers or out of range also fall back to today, so
+    they never reach date() or become cache keys.
+    """
+    today = date.today()
+    month_raw = args.get("month")
+    year_raw = args.get("year")
+
+    try:
+        month = int(month_raw) if month_raw else today.month
+    except ValueError:
+        month = today.month
+
+    try:
+        year = int(year_raw) if year_raw else today.year
+    except ValueError:
+        year = today.year
+
+    if not 1 <= month <= 12:
+        month = today.month
+    if not MINYEAR <= year <= MAXYEAR:
+        year = today.year
+
+    return month, year
+
+
+def employee_id_from_args(args):
+    try:
+        return int(args.get("employee_id") or 0)
+    except ValueError:
+        return 0
+
+
+class FragmentCache:
+    """Small in-process LRU of rendered template fragments."""
+
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key):
+        with self._lock:
+            html = self._entries.get(key)
+            if html is not None:
+                self._entries.move_to_end(key)
+            return html
+
+    def set(self, key, html):
+        max_entries = current_app.config.get("FRAGMENT_CACHE_SIZE", 64)
+        with self._lock:
+            self._entries[key] = html
+            self._entries.move_to_end(key)
+            while len(self._entries) > max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+fragment_cache = FragmentCache()
+
+
+HR_MODELS = (Employee, Attendance)
+
+
+def _touches_hr(session):
+    if any(isinstance(obj, HR_MODELS) for obj in chain(session.new, session.deleted)):
+        return True
+    return any(
+        isinstance(obj, HR_MODELS) and session.is_modified(obj, include_collections=False)
+        for obj in session.dirty
+    )
+
+
+def _bump_hr_version(session, flush_context):
+    if not _touches_hr(session):
+        return
+
+    # Same transaction as the flush, so the bump commits or rolls back with the write
+    bump_version(session.connection(), HR)
+
+
+def register_version_tracking():
+    if not event.contains(db.session, "after_flush", _bump_hr_version):
+        event.listen(db.session, "after_flush", _bump_hr_version)
+
+
+def hr_data_version():
+    """Counter of committed employee and attendance writes, shared by all worker processes.
+
+    Row counts and ids can repeat after a delete (SQLite reuses the last id),
+    so the cache keys on this counter, which only ever increases.
+    """
+    return read_version(HR)
+
+
+def cached_fragment(name, month, year, render):
+    """Return the rendered fragment `name` for month/year, rendering on a miss."""
+    key = (name, month, year, hr_data_version())
+    html = fragment_cache.get(key)
+    if html is None:
+        html = render()
+        fragment_cache.set(key, html)
+    return Markup(html)
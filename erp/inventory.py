@@ -0,0 +1,51 @@
+from flask import Blueprint, render_template, request, redirect, url_for, flash
+
+from .auth import login_required
+from .extensions import db
+from .models import InventoryItem
+
+bp = Blueprint("inventory", __name__)
+
+
+@bp.route("/inventory", methods=["GET", "POST"])
+@login_required
+def inventory():
+    if request.method == "POST":
+        sku = (request.form.get("sku") or "").strip()
+        name = (request.form.get("name") or "").strip()
+        category = (request.form.get("category") or "").strip()
+        quantity = int(request.form.get("quantity") or 0)
+        reorder_level = int(request.form.get("reorder_level") or 0)
+
+        if not sku or not name or not category:
+            flash("SKU, Name and Category are required.", "error")
+        else:
+            existing = InventoryItem.query.filter_by(sku=sku).first()
+            if existing:
+                flash("An item with this SKU already exists.", "error")
+            else:
+                item = InventoryItem(
+                    sku=sku,
+                    name=name,
+                    category=category,
+                    quantity=quantity,
+                    reorder_level=reorder_level
+                )
+                db.session.add(item)
+                db.session.commit()
+                flash("Inventory item added.", "success")
+
+        return redirect(url_for("inventory.inventory"))
+
+    items = InventoryItem.query.order_by(InventoryItem.id.desc()).all()
+    return render_template("inventory.html", page_title="Inventory", items=items)
+
+
+@bp.route("/inventory/delete/<int:item_id>", methods=["POST"])
+@login_required
+def delete_inventory(item_id):
+    item = InventoryItem.query.get_or_404(item_id)
+    db.session.delete(item)
+    db.session.commit()
+    flash("Item deleted.", "success")
+    return redirect(url_for("inventory.inventory"))
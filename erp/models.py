@@ -0,0 +1,137 @@
+from .extensions import db
+
+
+class InventoryItem(db.Model):
+    __tablename__ = 'inventory_items'
+    id = db.Column(db.Integer, primary_key=True)
+    sku = db.Column(db.String(50), unique=True, nullable=False)
+    name = db.Column(db.String(120), nullable=False)
+    category = db.Column(db.String(80), nullable=False)
+    quantity = db.Column(db.Integer, nullable=False, default=0)
+    reorder_level = db.Column(db.Integer, nullable=False, default=10)
+
+
+class Customer(db.Model):
+    __tablename__ = 'customers'
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(120), nullable=False)
+    email = db.Column(db.String(120))
+    phone = db.Column(db.String(50))
+    company = db.Column(db.String(120))
+
+
+class Order(db.Model):
+    __tablename__ = 'orders'
+    id = db.Column(db.Integer, primary_key=True)
+    order_number = db.Column(db.String(50), unique=True, nullable=False)
+    customer_name = db.Column(db.String(120), nullable=False)
+    amount = db.Column(db.Float, nullable=False, default=0.0)
+    status = db.Column(db.String(30), nullable=False, default="Pending")
+
+
+class Employee(db.Model):
+    __tablename__ = 'employees'
+    id = db.Column(db.Integer, primary_key=True)
+    emp_code = db.Column(db.String(50), unique=True, nullable=False)
+    name = db.Column(db.String(120), nullable=False)
+    department = db.Column(db.String(80))
+    designation = db.Column(db.String(80))
+    email = db.Column(db.String(120))
+    phone = db.Column(db.String(50))
+    date_of_joining = db.Column(db.String(20))  # e.g. "2023-05-01"
+    status = db.Column(db.String(30), default="Active")
+    salary = db.Column(db.Float, default=0.0)  # monthly salary
+
+    # bank details
+    bank_name = db.Column(db.String(120))
+    bank_account = db.Column(db.String(50))
+    bank_ifsc = db.Column(db.String(20))
+
+
+class Attendance(db.Model):
+    __tablename__ = 'attendance'
+    # Per-employee date ranges (detail modal, payroll) are the common read
+    __table_args__ = (
+        db.Index('ix_attendance_employee_date', 'employee_id', 'date'),
+    )
+    id = db.Column(db.Integer, primary_key=True)
+    employee_id = db.Column(db.Integer, db.ForeignKey('employees.id'), nullable=False)
+    date = db.Column(db.Date, nullable=False)
+    check_in = db.Column(db.Time)
+    check_out = db.Column(db.Time)
+    status = db.Column(db.String(20), default="Present")  # Present / Absent / Leave
+    remarks = db.Column(db.String(200))
+
+    employee = db.relationship('Employee', backref=db.backref('attendance_records', lazy=True))
+
+
+class Admin(db.Model):
+    __tablename__ = 'admins'
+    id = db.Column(db.Integer, primary_key=True)
+    username = db.Column(db.String(50), unique=True, nullable=False)
+    password = db.Column(db.String(200), nullable=False)  # hashed
+
+
+class UserSession(db.Model):
+    __tablename__ = 'user_sessions'
+    sid = db.Column(db.String(64), primary_key=True)
+    data = db.Column(db.Text, nullable=False)  # tagged JSON
+    expires_at = db.Column(db.DateTime, nullable=False)
+
+
+class ChangeLogEntry(db.Model):
+    __tablename__ = 'change_log'
+    # AUTOINCREMENT so sequence numbers are never reused after compaction
+    __table_args__ = (
+        db.Index('ix_change_log_row', 'table_name', 'row_id'),
+        {'sqlite_autoincrement': True},
+    )
+    seq = db.Column(db.Integer, primary_key=True)
+    table_name = db.Column(db.String(50), nullable=False)
+    row_id = db.Column(db.Integer, nullable=False)
+    op = db.Column(db.String(10), nullable=False)  # insert / update / delete
+    data = db.Column(db.Text)  # JSON snapshot of the row (last state for deletes)
+    created_at = db.Column(db.DateTime, nullable=False)
+
+
+# Counters that only ever increase, bumped by writes to the data they name
+class DataVersion(db.Model):
+    __tablename__ = 'data_versions'
+    name = db.Column(db.String(50), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+
+
+# Per employee-month facts the analytics cube is aggregated from
+class AnalyticsEmployeeMonth(db.Model):
+    __tablename__ = 'analytics_employee_months'
+    employee_id = db.Column(db.Integer, primary_key=True)
+    year = db.Column(db.Integer, primary_key=True)
+    month = db.Column(db.Integer, primary_key=True)
+    department = db.Column(db.String(80), nullable=False)
+    status = db.Column(db.String(30), nullable=False)
+    present_days = db.Column(db.Integer, nullable=False, default=0)
+    absent_days = db.Column(db.Integer, nullable=False, default=0)
+    leave_days = db.Column(db.Integer, nullable=False, default=0)
+    shortfall_hours = db.Column(db.Float, nullable=False, default=0.0)
+    payroll_cost = db.Column(db.Float, nullable=False, default=0.0)
+
+
+class AnalyticsCell(db.Model):
+    __tablename__ = 'analytics_cube'
+    department = db.Column(db.String(80), primary_key=True)
+    year = db.Column(db.Integer, primary_key=True)
+    month = db.Column(db.Integer, primary_key=True)
+    status = db.Column(db.String(30), primary_key=True)  # employee status
+    headcount = db.Column(db.Integer, nullable=False, default=0)
+    present_days = db.Column(db.Integer, nullable=False, default=0)
+    absent_days = db.Column(db.Integer, nullable=False, default=0)
+    leave_days = db.Column(db.Integer, nullable=False, default=0)
+    shortfall_hours = db.Column(db.Float, nullable=False, default=0.0)
+    payroll_cost = db.Column(db.Float, nullable=False, default=0.0)
+
+
+class AnalyticsState(db.Model):
+    __tablename__ = 'analytics_state'
+    NOT_BUILT = -1  # last_seq until the first full build
+    id = db.Column(db.Integer, primary_key=True)
+    last_seq = db.Column(db.Integer, nullable=False, default=0)  # change_log watermark
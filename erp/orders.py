@@ -0,0 +1,39 @@
+from flask import Blueprint, render_template, request, redirect, url_for, flash
+
+from .auth import login_required
+from .extensions import db
+from .models import Order
+
+bp = Blueprint("orders", __name__)
+
+
+@bp.route("/orders", methods=["GET", "POST"])
+@login_required
+def orders_page():
+    if request.method == "POST":
+        order_number = (request.form.get("order_number") or "").strip()
+        customer_name = (request.form.get("customer_name") or "").strip()
+        amount = float(request.form.get("amount") or 0)
+        status = request.form.get("status") or "Pending"
+
+        if not order_number or not customer_name:
+            flash("Order number and Customer name are required.", "error")
+        else:
+            existing = Order.query.filter_by(order_number=order_number).first()
+            if existing:
+                flash("Order with this number already exists.", "error")
+            else:
+                order = Order(
+                    order_number=order_number,
+                    customer_name=customer_name,
+                    amount=amount,
+                    status=status
+                )
+                db.session.add(order)
+                db.session.commit()
+                flash("Order created.", "success")
+
+        return redirect(url_for("orders.orders_page"))
+
+    orders = Order.query.order_by(Order.id.desc()).all()
+    return render_template("orders.html", page_title="Orders", orders=orders)
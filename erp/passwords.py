@@ -0,0 +1,44 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from threading import Lock
+
+from flask import current_app
+from werkzeug.security import generate_password_hash, check_password_hash
+
+# A concurrency cap, not an async offload: the calling request thread still
+# blocks until its hash is done. hashlib's pbkdf2/scrypt release the GIL, so
+# under a threaded server the pool only bounds how many hashes (and cores) a
+# login burst can occupy at once; a single synchronous worker gains nothing.
+_executor = None
+_executor_lock = Lock()
+
+
+def _pool():
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                workers = current_app.config.get("PASSWORD_HASH_WORKERS", 4)
+                _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pwhash")
+    return _executor
+
+
+@lru_cache(maxsize=8)
+def _method_prefix(method):
+    """Expand a method like "scrypt" to the prefix werkzeug stores, e.g. "scrypt:32768:8:1"."""
+    return generate_password_hash("", method=method, salt_length=1).split("$", 1)[0]
+
+
+def hash_password(password):
+    method = current_app.config.get("PASSWORD_HASH_METHOD", "scrypt")
+    return _pool().submit(generate_password_hash, password, method).result()
+
+
+def verify_password(stored_hash, password):
+    return _pool().submit(check_password_hash, stored_hash, password).result()
+
+
+def needs_rehash(stored_hash):
+    """True when `stored_hash` was made with parameters other than the configured policy."""
+    method = current_app.config.get("PASSWORD_HASH_METHOD", "scrypt")
+    return stored_hash.split("$", 1)[0] != _method_prefix(method)
@@ -0,0 +1,187 @@
+from flask import Blueprint, current_app, render_template, request, jsonify
+from collections import defaultdict
+from datetime import date, timedelta
+
+from .attendance_store import employee_attendance, shift_hours
+from .auth import login_required
+from .fragments import MONTH_NAMES, cached_fragment, employee_id_from_args, month_year_from_args
+from .models import Employee
+
+bp = Blueprint("payroll", __name__)
+
+
+# Policy knobs read from config (PAYROLL_<NAME upper>); see payroll_policy().
+POLICY_KEYS = ("allowed_leaves", "days_per_month", "hours_per_month", "hours_per_week")
+
+
+def payroll_policy(overrides=None):
+    """Current payroll policy as a dict, optionally with some values replaced."""
+    policy = {
+        "allowed_leaves": current_app.config.get("PAYROLL_ALLOWED_LEAVES", 25),
+        "days_per_month": current_app.config.get("PAYROLL_DAYS_PER_MONTH", 30),
+        "hours_per_month": current_app.config.get("PAYROLL_HOURS_PER_MONTH", 160),
+        "hours_per_week": current_app.config.get("PAYROLL_HOURS_PER_WEEK", 40),
+    }
+    if overrides:
+        policy.update(overrides)
+    return policy
+
+
+def compute_payroll_for_employee(emp, month, year, policy=None):
+    """Return a dict with salary breakdown for one employee for a given month/year."""
+    policy = policy or payroll_policy()
+    base_salary = emp.salary or 0.0
+
+    # Month range
+    month_start = date(year, month, 1)
+    if month == 12:
+        month_end = date(year + 1, 1, 1) - timedelta(days=1)
+    else:
+        month_end = date(year, month + 1, 1) - timedelta(days=1)
+
+    # --- Annual leave logic ---
+    # All LEAVE records in this year, ordered by date
+    leaves_year = employee_attendance(
+        emp.id, date(year, 1, 1), date(year, 12, 31), statuses=("Leave",)
+    )
+
+    total_leaves_used = len(leaves_year)
+    allowed_leaves = policy["allowed_leaves"]
+
+    unpaid_leaves_in_month = 0
+    # Leaves beyond the allowance in the year are unpaid; count those that fall in this month
+    for idx, rec in enumerate(leaves_year, start=1):
+        if idx > allowed_leaves and rec.date.year == year and rec.date.month == month:
+            unpaid_leaves_in_month += 1
+
+    # Assume salary is for 30 days (PAYROLL_DAYS_PER_MONTH)
+    daily_rate = base_salary / policy["days_per_month"] if base_salary else 0.0
+    extra_leave_deduction = unpaid_leaves_in_month * daily_rate
+
+    # --- Weekly 40 hours logic (PAYROLL_HOURS_PER_WEEK) ---
+    week_hours = defaultdict(float)
+
+    records_month = employee_attendance(
+        emp.id, month_start, month_end, statuses=("Present",)
+    )
+
+    for rec in records_month:
+        hours = shift_hours(rec.date, rec.check_in, rec.check_out)
+        if hours is not None:
+            iso_year, iso_week, _ = rec.date.isocalendar()
+            key = (iso_year, iso_week)
+            week_hours[key] += max(0.0, hours)
+
+    week_target = policy["hours_per_week"]
+    total_shortfall_hours = 0.0
+    for _, hours in week_hours.items():
+        if hours < week_target:
+            total_shortfall_hours += (week_target - hours)
+
+    # Assume monthly salary covers ~160 working hours (PAYROLL_HOURS_PER_MONTH)
+    hourly_rate = base_salary / policy["hours_per_month"] if base_salary else 0.0
+    hours_deduction = total_shortfall_hours * hourly_rate
+
+    net_pay = max(0.0, base_salary - extra_leave_deduction - hours_deduction)
+
+    remaining_leaves = max(0, allowed_leaves - total_leaves_used)
+
+    return {
+        "employee": emp,
+        "base_salary": base_salary,
+        "unpaid_leaves_in_month": unpaid_leaves_in_month,
+        "extra_leave_deduction": extra_leave_deduction,
+        "total_leaves_used": total_leaves_used,
+        "allowed_leaves": allowed_leaves,
+        "remaining_leaves": remaining_leaves,
+        "total_shortfall_hours": round(total_shortfall_hours, 2),
+        "hours_deduction": hours_deduction,
+        "net_pay": net_pay,
+    }
+
+
+@bp.route("/payroll")
+@login_required
+def payroll_page():
+    month, year = month_year_from_args(request.args)
+
+    return render_template(
+        "payroll.html",
+        page_title="Payroll",
+        table_body=render_payroll_body(month, year),
+        month=month,
+        year=year,
+        month_names=MONTH_NAMES,
+        selected_row=selected_payroll_row(request.args, month, year)
+    )
+
+
+@bp.route("/payroll/fragment/table")
+@login_required
+def payroll_table_fragment():
+    month, year = month_year_from_args(request.args)
+    return render_payroll_body(month, year)
+
+
+@bp.route("/payroll/fragment/detail")
+@login_required
+def payroll_detail_fragment():
+    month, year = month_year_from_args(request.args)
+    return render_template(
+        "partials/payroll_detail.html",
+        month=month,
+        year=year,
+        month_names=MONTH_NAMES,
+        selected_row=selected_payroll_row(request.args, month, year)
+    )
+
+
+@bp.route("/payroll/simulate")
+@login_required
+def payroll_simulate():
+    """What-if payroll cost, e.g. ?year=2025&allowed_leaves=20,25&hours_per_week=40,45"""
+    from .payroll_sim import simulate_payroll
+
+    _, year = month_year_from_args(request.args)
+    try:
+        grid = {}
+        for key in POLICY_KEYS:
+            raw = (request.args.get(key) or "").strip()
+            if raw:
+                cast = int if key == "allowed_leaves" else float
+                grid[key] = [cast(v) for v in raw.split(",") if v.strip()]
+        months_raw = (request.args.get("months") or "").strip()
+        months = [int(m) for m in months_raw.split(",") if m.strip()] if months_raw else None
+        if months and not all(1 <= m <= 12 for m in months):
+            raise ValueError("months must be between 1 and 12")
+
+        return jsonify(simulate_payroll(grid, year, months))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+
+def render_payroll_body(month, year):
+    """Rendered <tbody> rows of the monthly payroll, cached per data version."""
+    def render():
+        rows = []
+        for emp in Employee.query.order_by(Employee.name).all():
+            rows.append(compute_payroll_for_employee(emp, month, year))
+
+        return render_template(
+            "partials/payroll_rows.html",
+            rows=rows,
+            month=month,
+            year=year
+        )
+
+    return cached_fragment("payroll_rows", month, year, render)
+
+
+def selected_payroll_row(args, month, year):
+    """Detail modal data (when clicking one employee)."""
+    eid = employee_id_from_args(args)
+    if eid:
+        emp = Employee.query.get(eid)
+        if emp:
+            return compute_payroll_for_employee(emp, month, year)
+    return None
@@ -0,0 +1,217 @@
+from array import array
+from collections import defaultdict
+from datetime import date
+from itertools import product
+from math import prod
+
+from flask import current_app
+
+from .attendance_store import NO_TIME, STATUS_CODES, load_year_columns
+from .extensions import db
+from .models import Employee
+from .payroll import POLICY_KEYS, payroll_policy
+
+UNASSIGNED = "Unassigned"
+
+
+def _first_payroll_month(date_of_joining, year):
+    """First month of `year` the employee is on payroll; 13 when they join after it."""
+    try:
+        joined = date.fromisoformat((date_of_joining or "")[:10])
+    except ValueError:
+        return 1  # unknown joining date: count the whole year
+    if joined.year < year:
+        return 1
+    if joined.year > year:
+        return 13
+    return joined.month
+
+
+def load_payroll_inputs(year, months=None, employee_ids=None, from_joining=False):
+    """Column store of everything payroll needs for `year`, from a single attendance query.
+
+    With `from_joining`, months before an employee's date of joining are left
+    out. Payroll itself pays them, so the simulator keeps them.
+    """
+    months = sorted(set(months or range(1, 13)))
+
+    employee_query = db.session.query(
+        Employee.id, Employee.department, Employee.salary, Employee.date_of_joining
+    )
+    if employee_ids is not None:
+        employee_query = employee_query.filter(Employee.id.in_(employee_ids))
+    employees = employee_query.order_by(Employee.id).all()
+
+    attendance = load_year_columns(year, employee_ids, statuses=("Leave", "Present"))
+
+    # Same rules as compute_payroll_for_employee(): Leave rows count towards
+    # the yearly allowance, Present rows with both times add weekly hours.
+    leave_code = STATUS_CODES["Leave"]
+    calendar = {}  # day ordinal -> (month, iso week key)
+    leaves = defaultdict(lambda: [0] * 13)
+    week_hours = defaultdict(lambda: defaultdict(float))
+    for employee_id, day, check_in, check_out, status in zip(
+        attendance.employee_id, attendance.day, attendance.check_in,
+        attendance.check_out, attendance.status,
+    ):
+        if day not in calendar:
+            d = date.fromordinal(day)
+            calendar[day] = (d.month, tuple(d.isocalendar())[:2])
+        month, week = calendar[day]
+        if status == leave_code:
+            leaves[employee_id][month] += 1
+        elif check_in != NO_TIME and check_out != NO_TIME:
+            week_hours[(employee_id, month)][week] += max(0.0, (check_out - check_in) / 3600.0)
+
+    columns = {
+        "employee_id": array("i"),
+        "month": array("i"),
+        "department": [],
+        "salary": array("d"),
+        "leaves_before": array("i"),
+        "leaves_in_month": array("i"),
+        "week_hours": [],
+    }
+    for employee_id, department, salary, date_of_joining in employees:
+        per_month = leaves.get(employee_id, [0] * 13)
+        first_month = _first_payroll_month(date_of_joining, year) if from_joining else 1
+        for month in months:
+            if month < first_month:
+                continue
+            columns["employee_id"].append(employee_id)
+            columns["month"].append(month)
+            columns["department"].append(department or UNASSIGNED)
+            columns["salary"].append(salary or 0.0)
+            columns["leaves_before"].append(sum(per_month[1:month]))
+            columns["leaves_in_month"].append(per_month[month])
+            columns["week_hours"].append(tuple(week_hours.get((employee_id, month), {}).values()))
+
+    columns["year"] = year
+    columns["months"] = months
+    return columns
+
+
+def _validate(policy):
+    for key in POLICY_KEYS:
+        value = policy[key]
+        if key == "allowed_leaves":
+            if value < 0:
+                raise ValueError("allowed_leaves must be zero or more")
+        elif value <= 0:
+            raise ValueError(f"{key} must be greater than zero")
+
+
+def payroll_columns(inputs, policy, unpaid_cache=None, shortfall_cache=None):
+    """(unpaid leave days, shortfall hours, net pay) per employee-month under `policy`.
+
+    The caches are dicts keyed by allowance / weekly target, shared between
+    calls so scenarios with the same value reuse the column.
+    """
+    unpaid_cache = {} if unpaid_cache is None else unpaid_cache
+    shortfall_cache = {} if shortfall_cache is None else shortfall_cache
+
+    allowed = policy["allowed_leaves"]
+    unpaid = unpaid_cache.get(allowed)
+    if unpaid is None:
+        # Leaves beyond the allowance are unpaid; those falling in this month
+        unpaid = array("i", (
+            min(max(before + in_month - allowed, 0), in_month)
+            for before, in_month in zip(inputs["leaves_before"], inputs["leaves_in_month"])
+        ))
+        unpaid_cache[allowed] = unpaid
+
+    target = policy["hours_per_week"]
+    shortfall = shortfall_cache.get(target)
+    if shortfall is None:
+        shortfall = array("d", (
+            sum(target - hours for hours in weeks if hours < target)
+            for weeks in inputs["week_hours"]
+        ))
+        shortfall_cache[target] = shortfall
+
+    days = float(policy["days_per_month"])
+    hours_per_month = float(policy["hours_per_month"])
+
+    net_pay = array("d")
+    for salary, unpaid_days, short_hours in zip(inputs["salary"], unpaid, shortfall):
+        pay = 0.0
+        if salary:
+            deduction = unpaid_days * salary / days + short_hours * salary / hours_per_month
+            pay = max(0.0, salary - deduction)
+        net_pay.append(pay)
+
+    return unpaid, shortfall, net_pay
+
+
+def _cost_by_department(inputs, policy, unpaid_cache, shortfall_cache):
+    _, _, net_pay = payroll_columns(inputs, policy, unpaid_cache, shortfall_cache)
+    costs = defaultdict(float)
+    for department, pay in zip(inputs["department"], net_pay):
+        costs[department] += pay
+    return dict(costs)
+
+
+def expand_grid(grid):
+    """List of full policies for every combination in `grid` ({key: [values]})."""
+    unknown = set(grid) - set(POLICY_KEYS)
+    if unknown:
+        raise ValueError(f"Unknown policy parameter(s): {', '.join(sorted(unknown))}")
+
+    keys = [k for k in POLICY_KEYS if k in grid]
+    # Every scenario is a full pass over the employee-months, so cap the product
+    count = prod(len(grid[k]) for k in keys)
+    limit = current_app.config.get("PAYROLL_SIM_MAX_SCENARIOS", 64)
+    if count > limit:
+        raise ValueError(f"Grid has {count} scenarios; at most {limit} are allowed")
+
+    policies = []
+    for values in product(*(grid[k] for k in keys)):
+        policy = payroll_policy(dict(zip(keys, values)))
+        _validate(policy)
+        policies.append(policy)
+    return policies
+
+
+def simulate_payroll(grid, year, months=None):
+    """Payroll cost of every scenario in `grid`, with deltas against the current policy per department.
+
+    Attendance is loaded once into per employee-month columns; scenarios are
+    evaluated over those columns, sharing the unpaid-leave and shortfall
+    columns between scenarios with the same allowance or weekly target.
+    """
+    scenarios = expand_grid(grid)
+    inputs = load_payroll_inputs(year, months)
+    unpaid_cache, shortfall_cache = {}, {}
+
+    baseline_policy = payroll_policy()
+    baseline = _cost_by_department(inputs, baseline_policy, unpaid_cache, shortfall_cache)
+    baseline_total = sum(baseline.values())
+
+    results = []
+    for policy in scenarios:
+        costs = _cost_by_department(inputs, policy, unpaid_cache, shortfall_cache)
+        total = sum(costs.values())
+        results.append({
+            "policy": policy,
+            "total_cost": round(total, 2),
+            "total_delta": round(total - baseline_total, 2),
+            "departments": {
+                dept: {
+                    "cost": round(costs.get(dept, 0.0), 2),
+                    "delta": round(costs.get(dept, 0.0) - baseline.get(dept, 0.0), 2),
+                }
+                for dept in sorted(set(baseline) | set(costs))
+            },
+        })
+
+    return {
+        "year": year,
+        "months": inputs["months"],
+        "employee_months": len(inputs["salary"]),
+        "baseline": {
+            "policy": baseline_policy,
+            "total_cost": round(baseline_total, 2),
+            "departments": {dept: round(cost, 2) for dept, cost in sorted(baseline.items())},
+        },
+        "scenarios": results,
+    }
@@ -0,0 +1,67 @@
+from sqlalchemy import text
+
+from .extensions import db
+
+
+def _user_version(conn):
+    return conn.execute(text("PRAGMA user_version")).scalar() or 0
+
+
+def ensure_schema(app):
+    """Create missing tables unless the stored schema version is current.
+
+    SQLite keeps the version in ``PRAGMA user_version``, so a warm start costs
+    a single pragma read instead of a reflection pass over every table.
+    Other backends always fall through to ``create_all()``.
+    """
+    wanted = app.config.get("SCHEMA_VERSION", 0)
+    if db.engine.dialect.name != "sqlite":
+        create_tables()
+        return
+
+    with db.engine.connect() as conn:
+        if _user_version(conn) == wanted:
+            return
+
+    # Workers starting together all get here. BEGIN IMMEDIATE takes the write
+    # lock up front, so one creates the schema while the others wait, then
+    # re-read the version and find nothing left to do.
+    with db.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+        try:
+            if _user_version(conn) != wanted:
+                create_tables(conn)
+                conn.exec_driver_sql(f"PRAGMA user_version = {int(wanted)}")
+            conn.exec_driver_sql("COMMIT")
+        except BaseException:
+            conn.exec_driver_sql("ROLLBACK")
+            raise
+
+
+def create_tables(conn=None):
+    """create_all() plus the singleton rows later code only ever updates."""
+    if conn is None:
+        with db.engine.begin() as conn:
+            return create_tables(conn)
+
+    # Tables are only known to the metadata once the models are imported.
+    from .models import AnalyticsState, DataVersion
+    from .versions import TRACKED
+
+    db.metadata.create_all(conn)
+    # create_all() skips tables that already exist, indexes added to them later included
+    for table in db.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
+
+    # Rows another process already created are skipped rather than duplicated
+    _insert_missing(conn, DataVersion.__table__, [{"name": name, "version": 0} for name in TRACKED])
+    _insert_missing(conn, AnalyticsState.__table__, [{"id": 1, "last_seq": AnalyticsState.NOT_BUILT}])
+
+
+def _insert_missing(conn, table, rows):
+    key = list(table.primary_key.columns)[0]
+    existing = set(conn.execute(db.select(key)).scalars())
+    missing = [row for row in rows if row[key.name] not in existing]
+    if missing:
+        conn.execute(table.insert().prefix_with("OR IGNORE", dialect="sqlite"), missing)
@@ -0,0 +1,101 @@
+from datetime import date, datetime
+
+from .extensions import db
+from .models import InventoryItem, Customer, Order, Employee, Attendance, Admin
+from .passwords import hash_password
+
+
+def seed_demo_data():
+    # Inventory
+    if not InventoryItem.query.first():
+        items = [
+            InventoryItem(sku="SKU-001", name="A4 Paper Pack", category="Stationery", quantity=130, reorder_level=20),
+            InventoryItem(sku="SKU-002", name="Ink Cartridge 912XL", category="Printing", quantity=18, reorder_level=10),
+            InventoryItem(sku="SKU-003", name="Office Chair", category="Furniture", quantity=6, reorder_level=3),
+        ]
+        db.session.add_all(items)
+
+    # Customers
+    if not Customer.query.first():
+        customers = [
+            Customer(name="Saneesa Retail Pvt. Ltd.", email="info@saneesa.com", phone="9876543210", company="Saneesa"),
+            Customer(name="Brightway Traders", email="sales@brightway.in", phone="9988776655", company="Brightway"),
+        ]
+        db.session.add_all(customers)
+
+    # Orders
+    if not Order.query.first():
+        orders = [
+            Order(order_number="SO-1048", customer_name="Saneesa Retail Pvt. Ltd.", amount=42300.0, status="Paid"),
+            Order(order_number="SO-1047", customer_name="Brightway Traders", amount=15900.0, status="Overdue"),
+        ]
+        db.session.add_all(orders)
+
+    # Employees
+    if not Employee.query.first():
+        employees = [
+            Employee(
+                emp_code="EMP-001",
+                name="Riya Sharma",
+                department="HR",
+                designation="HR Manager",
+                email="riya.sharma@example.com",
+                phone="9876543210",
+                date_of_joining="2022-01-10",
+                status="Active",
+                salary=60000,
+                bank_name="HDFC Bank",
+                bank_account="50100234567890",
+                bank_ifsc="HDFC0001234"
+            ),
+            Employee(
+                emp_code="EMP-002",
+                name="Aditya Verma",
+                department="Sales",
+                designation="Sales Executive",
+                email="aditya.verma@example.com",
+                phone="9988776655",
+                date_of_joining="2021-09-05",
+                status="Active",
+                salary=45000,
+                bank_name="State Bank of India",
+                bank_account="12345678901",
+                bank_ifsc="SBIN0005678"
+            )
+        ]
+        db.session.add_all(employees)
+
+    # Some demo attendance (this month)
+    if not Attendance.query.first():
+        e1 = Employee.query.filter_by(emp_code="EMP-001").first()
+        e2 = Employee.query.filter_by(emp_code="EMP-002").first()
+        if e1 and e2:
+            today = date.today()
+            records = []
+            for i in range(1, 6):
+                d = date(today.year, today.month, i)
+                records.append(Attendance(
+                    employee_id=e1.id,
+                    date=d,
+                    check_in=datetime.strptime("09:30", "%H:%M").time(),
+                    check_out=datetime.strptime("18:00", "%H:%M").time(),
+                    status="Present"
+                ))
+                records.append(Attendance(
+                    employee_id=e2.id,
+                    date=d,
+                    check_in=datetime.strptime("10:00", "%H:%M").time(),
+                    check_out=datetime.strptime("18:30", "%H:%M").time(),
+                    status="Present"
+                ))
+            db.session.add_all(records)
+
+    # Admin user
+    if not Admin.query.first():
+        admin = Admin(
+            username="admin",
+            password=hash_password("admin123")
+        )
+        db.session.add(admin)
+
+    db.session.commit()
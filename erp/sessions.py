@@ -0,0 +1,183 @@
+import secrets
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from threading import Lock
+
+from flask.json.tag import TaggedJSONSerializer
+from flask.sessions import SessionInterface, SessionMixin
+from itsdangerous import BadSignature, Signer
+from werkzeug.datastructures import CallbackDict
+
+from .extensions import db
+from .models import UserSession
+
+
+def _utcnow():
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class ServerSideSession(CallbackDict, SessionMixin):
+    def __init__(self, initial=None, sid=None, new=False):
+        def on_update(self):
+            self.modified = True
+
+        super().__init__(initial, on_update)
+        self.sid = sid
+        self.loaded_sid = sid
+        self.new = new
+        self.modified = False
+
+    def clear(self):
+        # A cleared session (logout, fresh login) gets a new id on save,
+        # so a sid seen before authentication is never reused after it.
+        super().clear()
+        self.sid = None
+
+
+class _SessionCache:
+    """Per-process cache of sid -> (data, expires_at, cached_at)."""
+
+    def __init__(self, max_entries=1024):
+        self._entries = OrderedDict()
+        self._lock = Lock()
+        self.max_entries = max_entries
+
+    def get(self, sid, ttl):
+        with self._lock:
+            entry = self._entries.get(sid)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[2] > ttl:
+                del self._entries[sid]
+                return None
+            self._entries.move_to_end(sid)
+            return entry
+
+    def set(self, sid, data, expires_at):
+        with self._lock:
+            self._entries[sid] = (data, expires_at, time.monotonic())
+            self._entries.move_to_end(sid)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, sid):
+        with self._lock:
+            self._entries.pop(sid, None)
+
+
+class DatabaseSessionInterface(SessionInterface):
+    """Keeps session data in the `user_sessions` table; the cookie only holds a signed id.
+
+    Reads and writes go through the request's `db.session`, so a request
+    never holds a second pooled connection just for its session.
+
+    Recently used sessions are served from an in-process cache for up to
+    SESSION_CACHE_SECONDS, so `login_required` resolves `admin_id` without a
+    database read. A logout removes the entry in the worker that handled it at
+    once; other workers may keep accepting the old cookie until their cached
+    copy expires, so keep the window short.
+    """
+
+    serializer = TaggedJSONSerializer()
+
+    def __init__(self):
+        self.cache = _SessionCache()
+
+    def _signer(self, app):
+        return Signer(app.secret_key, salt="erp-session")
+
+    def _table(self):
+        return UserSession.__table__
+
+    def open_session(self, app, request):
+        cookie = request.cookies.get(self.get_cookie_name(app))
+        if not cookie or not app.secret_key:
+            return ServerSideSession(new=True)
+
+        try:
+            sid = self._signer(app).unsign(cookie).decode()
+        except BadSignature:
+            return ServerSideSession(new=True)
+
+        now = _utcnow()
+        ttl = app.config.get("SESSION_CACHE_SECONDS", 5)
+        entry = self.cache.get(sid, ttl)
+        if entry is None:
+            table = self._table()
+            row = db.session.execute(
+                db.select(table.c.data, table.c.expires_at).where(table.c.sid == sid)
+            ).first()
+            if row is None:
+                return ServerSideSession(new=True)
+            data = self.serializer.loads(row.data)
+            self.cache.set(sid, data, row.expires_at)
+            expires_at = row.expires_at
+        else:
+            data, expires_at = entry[:2]
+
+        if expires_at <= now:
+            return ServerSideSession(new=True)
+        return ServerSideSession(dict(data), sid=sid)
+
+    def save_session(self, app, session, response):
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+        secure = self.get_cookie_secure(app)
+        samesite = self.get_cookie_samesite(app)
+        httponly = self.get_cookie_httponly(app)
+        table = self._table()
+
+        if session.loaded_sid and session.sid != session.loaded_sid:
+            self._delete(session.loaded_sid)
+            session.loaded_sid = None
+
+        if not session:
+            if session.modified:
+                if session.sid:
+                    self._delete(session.sid)
+                response.delete_cookie(name, domain=domain, path=path,
+                                       secure=secure, samesite=samesite, httponly=httponly)
+            return
+
+        if not session.modified and session.sid:
+            return
+
+        if session.sid is None:
+            session.sid = secrets.token_urlsafe(32)
+        expires_at = _utcnow() + app.permanent_session_lifetime
+        data = self.serializer.dumps(dict(session))
+
+        updated = db.session.execute(
+            table.update().where(table.c.sid == session.sid).values(data=data, expires_at=expires_at)
+        ).rowcount
+        if not updated:
+            db.session.execute(table.insert().values(sid=session.sid, data=data, expires_at=expires_at))
+        db.session.commit()
+        self.cache.set(session.sid, dict(session), expires_at)
+
+        response.set_cookie(
+            name,
+            self._signer(app).sign(session.sid).decode(),
+            expires=self.get_expiration_time(app, session),
+            httponly=httponly,
+            domain=domain,
+            path=path,
+            secure=secure,
+            samesite=samesite,
+        )
+
+    def _delete(self, sid):
+        table = self._table()
+        db.session.execute(table.delete().where(table.c.sid == sid))
+        db.session.commit()
+        self.cache.discard(sid)
+
+
+def purge_expired_sessions():
+    """Delete expired rows from `user_sessions`; returns the number removed."""
+    table = UserSession.__table__
+    removed = db.session.execute(table.delete().where(table.c.expires_at <= _utcnow())).rowcount
+    db.session.commit()
+    return removed
@@ -0,0 +1,11 @@
+from flask import Blueprint, render_template
+
+from .auth import login_required
+
+bp = Blueprint("settings", __name__)
+
+
+@bp.route("/settings")
+@login_required
+def settings_page():
+    return render_template("settings.html", page_title="Settings")
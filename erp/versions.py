@@ -0,0 +1,20 @@
+from .extensions import db
+from .models import DataVersion
+
+# Counters in `data_versions`; rows are created with the schema
+HR = "hr"  # employee and attendance writes
+TRACKED = (HR,)
+
+
+def read_version(name):
+    return db.session.query(DataVersion.version).filter_by(name=name).scalar() or 0
+
+
+def bump_version(conn, name):
+    """Increment counter `name` on `conn`, inside the caller's transaction."""
+    table = DataVersion.__table__
+    bumped = conn.execute(
+        table.update().where(table.c.name == name).values(version=table.c.version + 1)
+    ).rowcount
+    if not bumped:
+        conn.execute(table.insert().values(name=name, version=1))
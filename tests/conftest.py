@@ -0,0 +1,56 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+sys.path.insert(0, ROOT)
+
+from erp import create_app  # noqa: E402
+from erp.extensions import db  # noqa: E402
+from erp.fragments import fragment_cache  # noqa: E402
+from erp.models import Admin, Employee  # noqa: E402
+from erp.passwords import hash_password  # noqa: E402
+
+
+def make_app(db_path, **overrides):
+    config = {
+        "TESTING": True,
+        "SQLALCHEMY_DATABASE_URI": "sqlite:///" + str(db_path),
+        "PASSWORD_HASH_METHOD": "pbkdf2:sha256:1000",
+    }
+    config.update(overrides)
+    return create_app(config)
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return tmp_path / "erp.db"
+
+
+@pytest.fixture
+def app(db_path):
+    fragment_cache.clear()
+    app = make_app(db_path)
+    with app.app_context():
+        db.session.add(Admin(username="admin", password=hash_password("secret")))
+        db.session.add_all([
+            Employee(emp_code="EMP-001", name="Riya Sharma", department="HR",
+                     date_of_joining="2020-01-01", salary=60000),
+            Employee(emp_code="EMP-002", name="Aditya Verma", department="Sales",
+                     date_of_joining="2020-01-01", salary=45000),
+        ])
+        db.session.commit()
+    yield app
+    fragment_cache.clear()
+
+
+def login(client):
+    response = client.post("/login", data={"username": "admin", "password": "secret"})
+    assert response.status_code == 302
+    return client
+
+
+@pytest.fixture
+def client(app):
+    return login(app.test_client())
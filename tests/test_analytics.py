@@ -0,0 +1,154 @@
+from datetime import date, time
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from erp import analytics
+from erp.analytics import query_cube, refresh_cube
+from erp.extensions import db
+from erp.models import AnalyticsCell, AnalyticsEmployeeMonth, AnalyticsState, Attendance, Employee
+
+
+def cube_snapshot():
+    def rows(model):
+        table = model.__table__
+        keys = list(table.primary_key.columns)
+        return [tuple(row) for row in db.session.execute(db.select(table).order_by(*keys))]
+    return rows(AnalyticsEmployeeMonth), rows(AnalyticsCell)
+
+
+def assert_matches_full_rebuild():
+    incremental = cube_snapshot()
+    refresh_cube(full=True)
+    assert cube_snapshot() == incremental
+
+
+def test_first_activity_in_a_year_builds_every_employee(app):
+    with app.app_context():
+        refresh_cube(full=True)
+        hr = Employee.query.filter_by(department="HR").one()
+        db.session.add(Attendance(employee_id=hr.id, date=date(2024, 3, 4), status="Present",
+                                  check_in=time(9), check_out=time(17)))
+        db.session.commit()
+
+        refresh_cube()
+        departments = db.session.execute(
+            db.select(AnalyticsCell.department).where(AnalyticsCell.year == 2024).distinct()
+        ).scalars().all()
+        assert sorted(departments) == ["HR", "Sales"]
+        assert_matches_full_rebuild()
+
+
+def test_incremental_refresh_matches_full_rebuild(app):
+    with app.app_context():
+        refresh_cube(full=True)
+        hr, sales = Employee.query.order_by(Employee.department).all()
+        db.session.add_all([
+            Attendance(employee_id=hr.id, date=date(2024, 5, 6), status="Leave"),
+            Attendance(employee_id=sales.id, date=date(2024, 5, 7), status="Present",
+                       check_in=time(10), check_out=time(16)),
+        ])
+        db.session.commit()
+        refresh_cube()
+        assert_matches_full_rebuild()
+
+        sales.department = "Ops"
+        db.session.commit()
+        refresh_cube()
+        assert_matches_full_rebuild()
+
+
+def test_years_without_attendance_are_dropped(app):
+    with app.app_context():
+        hr = Employee.query.filter_by(department="HR").one()
+        record = Attendance(employee_id=hr.id, date=date(2024, 3, 4), status="Present")
+        db.session.add(record)
+        db.session.commit()
+        refresh_cube(full=True)
+        assert AnalyticsCell.query.filter_by(year=2024).count()
+
+        db.session.delete(record)
+        db.session.commit()
+        refresh_cube()
+        assert not AnalyticsCell.query.filter_by(year=2024).count()
+        assert not AnalyticsEmployeeMonth.query.filter_by(year=2024).count()
+        assert_matches_full_rebuild()
+
+
+def test_full_rebuild_clears_untracked_years(app):
+    with app.app_context():
+        db.session.add(AnalyticsCell(department="HR", year=2019, month=1, status="Active", headcount=1))
+        db.session.commit()
+        refresh_cube(full=True)
+        assert not AnalyticsCell.query.filter_by(year=2019).count()
+
+
+def test_months_before_joining_are_left_out(app):
+    with app.app_context():
+        db.session.add(Employee(emp_code="EMP-003", name="New Joiner", department="HR",
+                                date_of_joining="2024-06-15", salary=30000))
+        db.session.add(Attendance(employee_id=1, date=date(2024, 1, 8), status="Present"))
+        db.session.commit()
+        joiner = Employee.query.filter_by(emp_code="EMP-003").one()
+        refresh_cube(full=True)
+
+        months = db.session.execute(
+            db.select(AnalyticsEmployeeMonth.month)
+            .where(AnalyticsEmployeeMonth.employee_id == joiner.id, AnalyticsEmployeeMonth.year == 2024)
+            .order_by(AnalyticsEmployeeMonth.month)
+        ).scalars().all()
+        assert months == list(range(6, 13))
+
+
+def test_future_months_only_with_projected(app):
+    with app.app_context():
+        refresh_cube(full=True)
+        today = date.today()
+        filters = {"year": [today.year]}
+
+        months = [row["month"] for row in query_cube(filters, ["month"])]
+        assert months == list(range(1, today.month + 1))
+
+        months = [row["month"] for row in query_cube(filters, ["month"], projected=True)]
+        assert months == list(range(1, 13))
+
+
+def test_requests_never_run_the_full_build(app, client):
+    with app.app_context():
+        # Created with the schema, so concurrent first requests cannot race to insert it
+        assert db.session.get(AnalyticsState, 1).last_seq == AnalyticsState.NOT_BUILT
+
+    assert client.get("/").status_code == 200
+    assert client.get("/analytics/cube?group_by=department").status_code == 503
+    with app.app_context():
+        assert not AnalyticsCell.query.count()
+        refresh_cube(full=True)
+
+    response = client.get("/analytics/cube?group_by=department")
+    assert response.status_code == 200
+    assert [row["department"] for row in response.get_json()["rows"]] == ["HR", "Sales"]
+
+
+def test_bad_query_is_rejected_before_the_build_check(client):
+    response = client.get("/analytics/cube?group_by=bogus")
+    assert response.status_code == 400
+    assert "bogus" in response.get_json()["error"]
+    assert client.get("/analytics/cube?year=abc").status_code == 400
+
+
+def test_failed_refresh_leaves_session_usable(app, monkeypatch):
+    with app.app_context():
+        refresh_cube(full=True)
+
+        def broken_refresh():
+            db.session.add(AnalyticsState(id=1, last_seq=0))
+            try:
+                db.session.flush()
+            except IntegrityError:
+                raise RuntimeError("refresh failed")
+
+        monkeypatch.setattr(analytics, "refresh_cube", broken_refresh)
+        with pytest.raises(RuntimeError):
+            analytics.refresh_cube_for_request()
+        # Would raise PendingRollbackError had the failed flush not been rolled back
+        assert db.session.get(AnalyticsState, 1).last_seq >= 0
@@ -0,0 +1,71 @@
+from datetime import date, time
+
+from erp.attendance_store import (
+    NO_TIME,
+    OTHER_STATUS,
+    STATUS_CODES,
+    AttendanceColumns,
+    AttendanceRow,
+    employee_attendance,
+    load_year_columns,
+)
+from erp.extensions import db
+from erp.models import Attendance, Employee
+
+
+def row(check_in, check_out):
+    return AttendanceRow(1, date(2025, 3, 3), check_in, check_out, "Present", None)
+
+
+def test_row_hours_rounding_and_missing_times():
+    assert row(time(9), time(17, 20)).hours == 8.33
+    assert row(time(9, 0, 1), time(9, 0, 2)).hours == 0.0
+    assert row(time(9), None).hours is None
+    assert row(None, time(17)).hours is None
+
+
+def test_columns_encode_missing_times_and_unknown_statuses():
+    columns = AttendanceColumns()
+    columns.append(7, date(2025, 3, 3), time(9, 30), None, "Present")
+    columns.append(7, date(2025, 3, 4), None, None, "Work from home")
+
+    assert len(columns) == 2
+    assert list(columns.day) == [date(2025, 3, 3).toordinal(), date(2025, 3, 4).toordinal()]
+    assert list(columns.check_in) == [9 * 3600 + 30 * 60, NO_TIME]
+    assert list(columns.check_out) == [NO_TIME, NO_TIME]
+    assert list(columns.status) == [STATUS_CODES["Present"], OTHER_STATUS]
+
+
+def seed_year(app):
+    with app.app_context():
+        riya, aditya = Employee.query.order_by(Employee.emp_code).all()
+        db.session.add_all([
+            Attendance(employee_id=riya.id, date=date(2025, 1, 6), status="Present", remarks="on site"),
+            Attendance(employee_id=riya.id, date=date(2025, 1, 7), status="Leave"),
+            Attendance(employee_id=aditya.id, date=date(2025, 1, 6), status="Absent"),
+            Attendance(employee_id=aditya.id, date=date(2024, 12, 31), status="Present"),
+        ])
+        db.session.commit()
+        return riya.id, aditya.id
+
+
+def test_load_year_columns_filters(app):
+    riya_id, aditya_id = seed_year(app)
+    with app.app_context():
+        assert len(load_year_columns(2025)) == 3
+        only_riya = load_year_columns(2025, employee_ids=[riya_id])
+        assert set(only_riya.employee_id) == {riya_id}
+        assert len(only_riya) == 2
+        leave = load_year_columns(2025, statuses=("Leave", "Absent"))
+        assert sorted(leave.status) == sorted([STATUS_CODES["Leave"], STATUS_CODES["Absent"]])
+        assert len(load_year_columns(2025, employee_ids=[aditya_id], statuses=("Present",))) == 0
+
+
+def test_employee_attendance_selects_remarks_only_on_request(app):
+    riya_id, _ = seed_year(app)
+    with app.app_context():
+        rows = employee_attendance(riya_id, date(2025, 1, 1), date(2025, 12, 31))
+        assert [r.date for r in rows] == [date(2025, 1, 6), date(2025, 1, 7)]
+        assert all(r.remarks is None for r in rows)
+        rows = employee_attendance(riya_id, date(2025, 1, 1), date(2025, 12, 31), statuses=("Present",), remarks=True)
+        assert [(r.status, r.remarks) for r in rows] == [("Present", "on site")]
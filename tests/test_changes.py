@@ -0,0 +1,59 @@
+from erp.changes import compact_change_log
+from erp.extensions import db
+from erp.models import ChangeLogEntry, Customer
+
+
+def log_entries():
+    return [(e.table_name, e.row_id, e.op) for e in ChangeLogEntry.query.order_by(ChangeLogEntry.seq)]
+
+
+def test_rolled_back_flush_logs_nothing(app):
+    with app.app_context():
+        before = ChangeLogEntry.query.count()
+        db.session.add(Customer(name="Ghost"))
+        db.session.flush()
+        db.session.rollback()
+        assert ChangeLogEntry.query.count() == before
+
+
+def test_compaction_keeps_newest_entry_per_row_and_seq_keeps_growing(app):
+    with app.app_context():
+        customer = Customer(name="Acme")
+        db.session.add(customer)
+        db.session.commit()
+        for name in ("Acme Ltd", "Acme Group"):
+            customer.name = name
+            db.session.commit()
+        max_before = db.session.query(db.func.max(ChangeLogEntry.seq)).scalar()
+
+        assert compact_change_log(0) > 0
+        kept = ChangeLogEntry.query.filter_by(table_name="customers", row_id=customer.id).all()
+        assert [(e.seq, e.op) for e in kept] == [(max_before, "update")]
+        assert '"Acme Group"' in kept[0].data
+
+        customer.name = "Acme Holdings"
+        db.session.commit()
+        newest = db.session.query(db.func.max(ChangeLogEntry.seq)).scalar()
+        assert newest > max_before
+
+
+def test_feed_paging(app, client):
+    with app.app_context():
+        db.session.add_all([Customer(name=f"Customer {i}") for i in range(5)])
+        db.session.commit()
+        total = ChangeLogEntry.query.count()
+
+    seen, since = [], 0
+    while True:
+        page = client.get(f"/changes?since={since}&limit=2").get_json()
+        assert len(page["changes"]) <= 2
+        seen.extend(change["seq"] for change in page["changes"])
+        assert page["next_since"] == (page["changes"][-1]["seq"] if page["changes"] else since)
+        since = page["next_since"]
+        if not page["has_more"]:
+            break
+
+    assert len(seen) == total
+    assert seen == sorted(seen)
+    empty = client.get(f"/changes?since={since}").get_json()
+    assert empty == {"changes": [], "next_since": since, "has_more": False}
@@ -0,0 +1,62 @@
+import re
+from datetime import date
+
+from erp.extensions import db
+from erp.fragments import hr_data_version, month_year_from_args
+from erp.models import Attendance, Employee
+
+
+def days_recorded(client, month, year):
+    html = client.get(f"/attendance/fragment/table?month={month}&year={year}").get_data(as_text=True)
+    return [int(n) for n in re.findall(r"<td>(\d+)</td>\s*<td>\s*<a", html)]
+
+
+def test_delete_then_insert_reusing_id_invalidates_cache(app, client):
+    with app.app_context():
+        riya, aditya = Employee.query.order_by(Employee.emp_code).all()
+        db.session.add_all([
+            Attendance(employee_id=riya.id, date=date(2025, 3, 3), status="Present"),
+            Attendance(employee_id=aditya.id, date=date(2025, 3, 3), status="Present"),
+            Attendance(employee_id=aditya.id, date=date(2025, 3, 4), status="Present"),
+        ])
+        db.session.commit()
+        last = Attendance.query.order_by(Attendance.id.desc()).first()
+        last_id, riya_id = last.id, riya.id
+
+    # Overview is ordered by name: Aditya, Riya
+    assert days_recorded(client, 3, 2025) == [2, 1]
+
+    with app.app_context():
+        before = hr_data_version()
+        db.session.delete(db.session.get(Attendance, last_id))
+        db.session.commit()
+        record = Attendance(employee_id=riya_id, date=date(2025, 3, 4), status="Present")
+        db.session.add(record)
+        db.session.commit()
+        # SQLite hands the deleted id out again; the version must still move
+        assert record.id == last_id
+        assert hr_data_version() > before
+
+    assert days_recorded(client, 3, 2025) == [1, 2]
+
+
+def test_rolled_back_write_keeps_version(app):
+    with app.app_context():
+        before = hr_data_version()
+        employee = Employee.query.first()
+        employee.salary = 1
+        db.session.flush()
+        db.session.rollback()
+        assert hr_data_version() == before
+
+
+def test_out_of_range_month_and_year_fall_back_to_today(client):
+    for query in ("month=13", "month=0", "month=-1", "year=0", "year=10000", "month=abc"):
+        assert client.get(f"/attendance/fragment/table?{query}").status_code == 200
+        assert client.get(f"/payroll/fragment/table?{query}").status_code == 200
+
+
+def test_month_year_from_args_clamps_to_today():
+    today = date.today()
+    assert month_year_from_args({"month": "13", "year": "2024"}) == (today.month, 2024)
+    assert month_year_from_args({"month": "2", "year": "0"}) == (2, today.year)
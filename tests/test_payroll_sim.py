@@ -0,0 +1,91 @@
+from datetime import date, datetime, time, timedelta
+
+import pytest
+
+from erp.extensions import db
+from erp.models import Attendance, Employee
+from erp.payroll import compute_payroll_for_employee
+from erp.payroll_sim import simulate_payroll
+
+
+def test_simulate_rejects_oversized_grid(app, client):
+    app.config["PAYROLL_SIM_MAX_SCENARIOS"] = 4
+    leaves = ",".join(str(n) for n in range(5))
+
+    response = client.get(f"/payroll/simulate?year=2025&allowed_leaves={leaves}")
+    assert response.status_code == 400
+    assert "5 scenarios" in response.get_json()["error"]
+
+    response = client.get("/payroll/simulate?year=2025&allowed_leaves=20,25&hours_per_week=40,45")
+    assert response.status_code == 200
+    assert len(response.get_json()["scenarios"]) == 4
+
+
+def payroll_total(year, months, policy=None):
+    return sum(
+        compute_payroll_for_employee(emp, month, year, policy)["net_pay"]
+        for emp in Employee.query.all()
+        for month in months
+    )
+
+
+def test_simulator_pays_months_before_joining_like_payroll(app):
+    with app.app_context():
+        db.session.add(Employee(emp_code="EMP-003", name="New Joiner", department="HR",
+                                date_of_joining="2025-06-15", salary=30000))
+        db.session.commit()
+
+        result = simulate_payroll({}, 2025)
+        assert result["baseline"]["total_cost"] == pytest.approx(payroll_total(2025, range(1, 13)), abs=0.01)
+
+
+def assert_matches_payroll(result, year, months):
+    employees = Employee.query.all()
+    for scenario in [result["baseline"]] + result["scenarios"]:
+        by_department = {}
+        for emp in employees:
+            pay = sum(compute_payroll_for_employee(emp, m, year, scenario["policy"])["net_pay"] for m in months)
+            department = emp.department or "Unassigned"
+            by_department[department] = by_department.get(department, 0.0) + pay
+
+        assert scenario["total_cost"] == pytest.approx(sum(by_department.values()), abs=0.01)
+        for department, pay in by_department.items():
+            cost = scenario["departments"][department]
+            if isinstance(cost, dict):  # scenarios also carry the delta to the baseline
+                cost = cost["cost"]
+            assert cost == pytest.approx(pay, abs=0.01)
+
+
+def add_day(employee_id, day, status="Present", hours=8.0):
+    check_in = check_out = None
+    if status == "Present":
+        check_in = time(9)
+        check_out = (datetime.combine(day, check_in) + timedelta(hours=hours)).time()
+    db.session.add(Attendance(employee_id=employee_id, date=day, status=status,
+                              check_in=check_in, check_out=check_out))
+
+
+def test_scenarios_match_compute_payroll(app):
+    with app.app_context():
+        riya, aditya = Employee.query.order_by(Employee.emp_code).all()
+        volunteer = Employee(emp_code="EMP-003", name="Volunteer", department="Sales", salary=0)
+        db.session.add(volunteer)
+        db.session.flush()
+
+        # Leaves that overflow small allowances across January and February
+        for day in (date(2025, 1, 6), date(2025, 1, 7), date(2025, 2, 3), date(2025, 2, 4), date(2025, 2, 5)):
+            add_day(riya.id, day, "Leave")
+        # A short week spanning March and April (Mon 31 March - Fri 4 April)
+        for day in (date(2025, 3, 31), date(2025, 4, 1), date(2025, 4, 2), date(2025, 4, 3)):
+            add_day(aditya.id, day, hours=7.5)
+        add_day(aditya.id, date(2025, 4, 4), hours=3)
+        for day in (date(2025, 3, 24), date(2025, 3, 25)):
+            add_day(volunteer.id, day, hours=4)
+        db.session.commit()
+
+        grid = {"allowed_leaves": [0, 2, 4], "hours_per_week": [30, 40]}
+        result = simulate_payroll(grid, 2025)
+        # Every scenario deducts something different, so the cases are exercised
+        assert len({s["total_cost"] for s in result["scenarios"]}) == 6
+        assert_matches_payroll(result, 2025, range(1, 13))
+        assert_matches_payroll(simulate_payroll(grid, 2025, months=[2, 4]), 2025, [2, 4])
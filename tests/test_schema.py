@@ -0,0 +1,22 @@
+import multiprocessing
+import sqlite3
+
+from conftest import make_app
+
+
+def _start_worker(db_path):
+    make_app(db_path)
+
+
+def test_concurrent_startup_creates_schema_once(db_path):
+    context = multiprocessing.get_context("fork")
+    workers = [context.Process(target=_start_worker, args=(db_path,)) for _ in range(12)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(60)
+    assert [worker.exitcode for worker in workers] == [0] * len(workers)
+
+    conn = sqlite3.connect(db_path)
+    assert conn.execute("SELECT name, version FROM data_versions").fetchall() == [("hr", 0)]
+    assert conn.execute("SELECT id, last_seq FROM analytics_state").fetchall() == [(1, -1)]
@@ -0,0 +1,54 @@
+import time
+
+from sqlalchemy import event
+
+from conftest import login, make_app
+from erp.extensions import db
+
+
+def test_logout_reaches_other_instances_once_their_cache_expires(app, db_path):
+    other = make_app(db_path, SESSION_CACHE_SECONDS=0.2)
+    client_a = login(app.test_client())
+    client_b = other.test_client()
+    client_b.set_cookie("session", client_a.get_cookie("session").value)
+
+    # Instance B loads the session and caches it
+    assert client_b.get("/attendance").status_code == 200
+
+    client_a.get("/logout")
+    # Within the window B still trusts its cached copy; that is the documented limit
+    assert client_b.get("/attendance").status_code == 200
+
+    time.sleep(0.3)
+    response = client_b.get("/attendance")
+    assert response.status_code == 302
+    assert "/login" in response.headers["Location"]
+
+
+def test_logout_is_immediate_on_the_same_instance(app):
+    client = login(app.test_client())
+    cookie = client.get_cookie("session").value
+    assert client.get("/settings").status_code == 200
+
+    client.get("/logout")
+    client.set_cookie("session", cookie)
+    assert client.get("/settings").status_code == 302
+
+
+def test_cached_session_needs_no_query(app):
+    client = login(app.test_client())
+    assert client.get("/settings").status_code == 200
+
+    with app.app_context():
+        engine = db.engine
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        assert client.get("/settings").status_code == 200
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+    assert statements == []